@@ -12,6 +12,38 @@ test cases to verify that your algorithm is working properly.
 The expected time complexity is O(log(n)).
 """
 
+import operator
+from typing import Iterable, Union
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; sqrt_many falls back to the scalar routine
+    np = None
+
+# Below this bound a float64 root is off by at most one and its
+# corrected square still fits in uint64
+VECTOR_LIMIT = 2 ** 63
+
+# Above this size binary search needs too many big-int multiplications
+NEWTON_THRESHOLD_BITS = 64
+
+def as_python_int(number: int) -> int:
+    """
+    Convert integer-likes such as NumPy integers to a Python int
+
+    Python ints provide bit_length and cannot overflow in mid * mid; other
+    inputs are returned unchanged.
+
+    Args:
+    number(int): Number to convert
+
+    Returns:
+    int: The same value as a Python int when it supports __index__
+    """
+    if not isinstance(number, int) and hasattr(number, "__index__"):
+        return operator.index(number)
+    return number
+
 def sqrt(number: int) -> int:
     """
     Calculate the floored square root of a number
@@ -22,6 +54,7 @@ def sqrt(number: int) -> int:
     Returns:
     int: Floored square root
     """
+    number = as_python_int(number)
 
     if number < 0:
         raise ValueError("Square root is not defined for negative numbers.")
@@ -29,11 +62,14 @@ def sqrt(number: int) -> int:
     if number == 0 or number == 1:
         return number
 
+    if number.bit_length() > NEWTON_THRESHOLD_BITS:
+        return sqrt_newton(number)
+
     # Binary search initialization
     start, end = 0, number
     result = 0
 
-    for _ in range(number + 1):  # Simulates the iterative process
+    while start <= end:
         mid = (start + end) // 2
         
         # Check if mid is the square root
@@ -46,13 +82,115 @@ def sqrt(number: int) -> int:
             result = mid  # Store the floor of the square root
         else:
             end = mid - 1  # Discard the right half
-        
-        # Break the loop when start surpasses end
-        if start > end:
-            break
 
     return result
 
+def sqrt_newton(number: int) -> int:
+    """
+    Calculate the floored square root of a number with Newton's method
+
+    The first guess 2 ** ceil(bits / 2) is never below the root, and each
+    step roughly doubles the number of correct bits, so a 2048-bit input
+    converges in about a dozen big-int divisions.
+
+    Args:
+    number(int): Number to find the floored square root
+
+    Returns:
+    int: Floored square root
+    """
+    number = as_python_int(number)
+    if number < 0:
+        raise ValueError("Square root is not defined for negative numbers.")
+
+    if number < 2:
+        return number
+
+    x = 1 << ((number.bit_length() + 1) // 2)
+    while True:
+        y = (x + number // x) // 2
+        # The estimates decrease monotonically until they reach the floor
+        if y >= x:
+            return x
+        x = y
+
+def sqrt_digit_by_digit(number: int) -> int:
+    """
+    Calculate the floored square root of a number one binary digit at a time
+
+    Uses only shifts, additions and comparisons, producing one bit of the
+    root per pair of input bits: O(bits) iterations with no multiplication.
+
+    Args:
+    number(int): Number to find the floored square root
+
+    Returns:
+    int: Floored square root
+    """
+    number = as_python_int(number)
+    if number < 0:
+        raise ValueError("Square root is not defined for negative numbers.")
+
+    if number < 2:
+        return number
+
+    result = 0
+    # Highest power of four not above number
+    bit = 1 << ((number.bit_length() - 1) & ~1)
+    while bit:
+        if number >= result + bit:
+            number -= result + bit
+            result = (result >> 1) + bit
+        else:
+            result >>= 1
+        bit >>= 2
+
+    return result
+
+def sqrt_many(values: Union[Iterable[int], "np.ndarray", "np.integer"]) -> Union[list[int], "np.ndarray"]:
+    """
+    Calculate the floored square roots of many integers at once
+
+    With NumPy, values below 2 ** 63 are rooted in float64 in one vectorized
+    call and then corrected in integer arithmetic. Below 2 ** 53 the float
+    conversion is exact; above it the relative error is still far too small
+    to move the floored root by more than one, so a single correction step
+    in each direction is exact. Larger uint64 values (and every value when
+    NumPy is missing) go through the scalar sqrt.
+
+    Args:
+    values(array-like of int): Non-negative integers, or a NumPy scalar or
+    0-d array
+
+    Returns:
+    numpy.ndarray or list[int]: Floored square roots, same shape as values
+    """
+    if np is None:
+        return [sqrt(int(value)) for value in values]
+
+    numbers = np.asarray(values)
+    if numbers.dtype.kind not in "iu":
+        # Object arrays of Python ints may exceed 64 bits
+        return np.array([sqrt(int(value)) for value in numbers.ravel()], dtype=object).reshape(numbers.shape)
+
+    if numbers.dtype.kind == "i" and (numbers < 0).any():
+        raise ValueError("Square root is not defined for negative numbers.")
+
+    roots = np.empty(numbers.shape, dtype=np.int64)
+    exact = numbers < VECTOR_LIMIT
+
+    small = numbers[exact].astype(np.uint64)
+    root = np.floor(np.sqrt(small.astype(np.float64))).astype(np.uint64)
+    # Roots stay below 2 ** 32 - 1, so these squares cannot overflow uint64
+    root -= (root * root > small).astype(np.uint64)
+    root += ((root + 1) * (root + 1) <= small).astype(np.uint64)
+    roots[exact] = root.astype(np.int64)
+
+    # Boolean-mask assignment also works for 0-d arrays, unlike np.nonzero
+    roots[~exact] = [sqrt(int(value)) for value in numbers[~exact]]
+
+    return roots
+
 if __name__ == "__main__":
     # Test cases
     print("Pass" if 3 == sqrt(9) else "Fail")   # Expected Output: Pass
@@ -60,3 +198,45 @@ if __name__ == "__main__":
     print("Pass" if 4 == sqrt(16) else "Fail")  # Expected Output: Pass
     print("Pass" if 1 == sqrt(1) else "Fail")   # Expected Output: Pass
     print("Pass" if 5 == sqrt(27) else "Fail")  # Expected Output: Pass
+    if np is not None:
+        numpy_passed = all(
+            root(value) == expected
+            for root in (sqrt, sqrt_newton, sqrt_digit_by_digit)
+            for value, expected in ((np.int64(27), 5), (np.uint64(2 ** 64 - 1), 2 ** 32 - 1), (np.int64(2 ** 63 - 1), 3037000499))
+        )
+        print("Pass" if numpy_passed else "Fail")  # Expected Output: Pass
+
+    # Large inputs: compare every path against the standard library
+    import math
+    import random
+
+    large_numbers = [2 ** 64, 2 ** 64 - 1, (2 ** 1024 + 7) ** 2, (2 ** 1024 + 7) ** 2 - 1]
+    large_numbers += [random.getrandbits(2048) for _ in range(20)]
+    for candidate in large_numbers:
+        expected = math.isqrt(candidate)
+        passed = sqrt(candidate) == sqrt_newton(candidate) == sqrt_digit_by_digit(candidate) == expected
+        print("Pass" if passed else "Fail")  # Expected Output: Pass
+
+    small_passed = all(
+        sqrt(n) == sqrt_newton(n) == sqrt_digit_by_digit(n) == math.isqrt(n) for n in range(10000)
+    )
+    print("Pass" if small_passed else "Fail")  # Expected Output: Pass
+
+    # Batch roots must match the scalar routine exactly, including just
+    # around perfect squares and beyond the float-exact range
+    batch = [n * n + delta for n in (0, 1, 2, 3, 94906265, 94906266, 2 ** 26 + 1) for delta in (0, 1) if n * n + delta >= 0]
+    batch += [k * k - 1 for k in (2, 94906266, 2 ** 27)]
+    batch += [2 ** 53 - 1, 2 ** 53, 2 ** 53 + 1, 2 ** 62 + 12345, 2 ** 63 - 1]
+    batch += [random.randrange(2 ** 63) for _ in range(1000)]
+    if np is not None:
+        batch_roots = sqrt_many(np.array(batch, dtype=np.int64)).tolist()
+    else:
+        batch_roots = sqrt_many(batch)
+    print("Pass" if batch_roots == [sqrt(n) for n in batch] else "Fail")  # Expected Output: Pass
+
+    # NumPy scalars and 0-d arrays keep their shape, on both sides of VECTOR_LIMIT
+    if np is not None:
+        scalar_passed = (int(sqrt_many(np.int64(27))) == 5
+                         and int(sqrt_many(np.array(2 ** 64 - 1, dtype=np.uint64))) == sqrt(2 ** 64 - 1)
+                         and sqrt_many(np.array(16)).shape == ())
+        print("Pass" if scalar_passed else "Fail")  # Expected Output: Pass
@@ -14,6 +14,8 @@ algorithm is correct. If necessary, add additional test cases to verify that
 your algorithm works correctly.
 """
 
+from bisect import bisect_left, bisect_right
+
 def rotated_array_search(input_list: list[int], number: int) -> int:
     """
     Find the index by searching in a rotated sorted array
@@ -25,32 +27,242 @@ def rotated_array_search(input_list: list[int], number: int) -> int:
     Returns:
     int: Index of the target number or -1 if not found
     """
-    def search(left: int, right: int) -> int:
-        # Base case: If the range is invalid (left > right), return -1
-        if left > right:
-            return -1
+    left, right = 0, len(input_list) - 1
 
+    while left <= right:
         mid = (left + right) // 2
-        
+
         # Check if the middle element is the target
         if input_list[mid] == number:
             return mid
-        
+
         # Determine if the left half is sorted
         if input_list[left] <= input_list[mid]:
             # Target is in the left half
             if input_list[left] <= number < input_list[mid]:
-                return search(left, mid - 1)
+                right = mid - 1
             else:
-                return search(mid + 1, right)
+                left = mid + 1
         else:
             # Target is in the right half
             if input_list[mid] < number <= input_list[right]:
-                return search(mid + 1, right)
+                left = mid + 1
+            else:
+                right = mid - 1
+
+    return -1
+
+def rotated_array_search_with_duplicates(input_list: list[int], number: int) -> int:
+    """
+    Find an index of a number in a rotated sorted array that may hold duplicates
+
+    Stays O(log n) unless the boundary values are repeated; when the left,
+    middle and right values are all equal the sorted half cannot be told
+    apart and both ends shrink by one, which is O(n) in the worst case.
+
+    Args:
+    input_list (list[int]): Input array to search
+    number (int): Target number to find
+
+    Returns:
+    int: An index of the target number or -1 if not found
+    """
+    left, right = 0, len(input_list) - 1
+
+    while left <= right:
+        mid = (left + right) // 2
+
+        if input_list[mid] == number:
+            return mid
+
+        if input_list[left] == input_list[mid] == input_list[right]:
+            left += 1
+            right -= 1
+        elif input_list[left] <= input_list[mid]:
+            if input_list[left] <= number < input_list[mid]:
+                right = mid - 1
+            else:
+                left = mid + 1
+        else:
+            if input_list[mid] < number <= input_list[right]:
+                left = mid + 1
             else:
-                return search(left, mid - 1)
+                right = mid - 1
+
+    return -1
 
-    return search(0, len(input_list) - 1)
+def find_pivot(input_list: list[int]) -> int:
+    """
+    Find the index where the original sorted order starts in a rotated array
+
+    Duplicates are allowed: when the middle and right values tie, the right
+    end is dropped unless it is itself the start of the sorted order, which
+    costs O(n) only when long runs of equal values straddle the rotation.
+
+    Args:
+    input_list (list[int]): Rotated sorted array
+
+    Returns:
+    int: Index of the first element in sorted order (0 if not rotated)
+    """
+    left, right = 0, len(input_list) - 1
+    while left < right:
+        mid = (left + right) // 2
+        # The start lies right of mid exactly when mid is in the upper run
+        if input_list[mid] > input_list[right]:
+            left = mid + 1
+        elif input_list[mid] < input_list[right]:
+            right = mid
+        elif input_list[right - 1] > input_list[right]:
+            return right
+        else:
+            right -= 1
+    return left
+
+class RotatedIndex:
+    """
+    Answer repeated searches over one rotated sorted array.
+
+    The rotation pivot is found once, in O(log n) for distinct values and O(n)
+    in the worst case when duplicates straddle the rotation; afterwards each
+    lookup is a single bisect over whichever sorted run can contain the
+    target. The bound and range queries treat the array as its sorted order
+    without copying it.
+
+    Attributes:
+    values (list[int]): The rotated sorted array
+    pivot (int): Index of the first element in sorted order
+    """
+
+    def __init__(self, input_list: list[int]) -> None:
+        """
+        Index a rotated sorted array
+
+        Args:
+        input_list (list[int]): Rotated sorted array
+        """
+        self.values: list[int] = input_list
+        self.pivot: int = find_pivot(input_list)
+
+    def _run(self, number: int) -> tuple[int, int]:
+        """
+        Return the [start, end) bounds of the sorted run that may hold number
+        """
+        if self.pivot == 0 or number < self.values[0]:
+            return self.pivot, len(self.values)
+        return 0, self.pivot
+
+    def search(self, number: int) -> int:
+        """
+        Find the index of a number
+
+        Args:
+        number (int): Target number to find
+
+        Returns:
+        int: An index of the target number or -1 if not found
+        """
+        if not self.values:
+            return -1
+        start, end = self._run(number)
+        index = bisect_left(self.values, number, start, end)
+        if index < end and self.values[index] == number:
+            return index
+        return -1
+
+    def search_many(self, numbers: list[int]) -> list[int]:
+        """
+        Find the indices of many numbers, fastest when they are sorted
+
+        For ascending queries, the lower bound of each bisect resumes from
+        the previous hit in the same run, so the searched range keeps shrinking.
+
+        Args:
+        numbers (list[int]): Target numbers, ideally in ascending order
+
+        Returns:
+        list[int]: Index of each target number or -1 if not found
+        """
+        if not self.values:
+            return [-1] * len(numbers)
+
+        results = []
+        lower_bounds = {}  # Run start -> resume position for ascending queries
+        previous = None
+        for number in numbers:
+            if previous is not None and number < previous:
+                lower_bounds.clear()
+            previous = number
+
+            start, end = self._run(number)
+            index = bisect_left(self.values, number, lower_bounds.get(start, start), end)
+            lower_bounds[start] = index
+            if index < end and self.values[index] == number:
+                results.append(index)
+            else:
+                results.append(-1)
+        return results
+
+    def lower_bound(self, number: int) -> int:
+        """
+        Count the elements smaller than number
+
+        This is the position number would take in the sorted order.
+
+        Args:
+        number (int): Value to rank
+
+        Returns:
+        int: Number of elements strictly less than number
+        """
+        return (bisect_left(self.values, number, self.pivot, len(self.values)) - self.pivot
+                + bisect_left(self.values, number, 0, self.pivot))
+
+    def upper_bound(self, number: int) -> int:
+        """
+        Count the elements smaller than or equal to number
+
+        Args:
+        number (int): Value to rank
+
+        Returns:
+        int: Number of elements less than or equal to number
+        """
+        return (bisect_right(self.values, number, self.pivot, len(self.values)) - self.pivot
+                + bisect_right(self.values, number, 0, self.pivot))
+
+    def count_range(self, low: int, high: int) -> int:
+        """
+        Count the elements with value in [low, high]
+
+        Args:
+        low (int): Smallest value to count
+        high (int): Largest value to count
+
+        Returns:
+        int: Number of elements in the closed range
+        """
+        if low > high:
+            return 0
+        return self.upper_bound(high) - self.lower_bound(low)
+
+    def indices_in_range(self, low: int, high: int) -> list[int]:
+        """
+        Find the indices of all elements with value in [low, high]
+
+        Args:
+        low (int): Smallest value to include
+        high (int): Largest value to include
+
+        Returns:
+        list[int]: Indices into values, ordered by ascending value
+        """
+        if low > high:
+            return []
+        size = len(self.values)
+        first, last = self.lower_bound(low), self.upper_bound(high)
+        # Sorted rank r lives at index (r + pivot) % size
+        return [(rank + self.pivot) % size for rank in range(first, last)]
 
 # Test function using provided test cases
 def test_function(test_case: list[list[int], int]) -> None:
@@ -105,3 +317,41 @@ if __name__ == '__main__':
     # Normal case: Number in the middle of the list
     test_function([[4, 5, 6, 7, 0, 1, 2], 6])
     # Expected output: Pass
+
+    # Repeated queries through a RotatedIndex, every rotation and target
+    all_passed = True
+    for size in range(0, 9):
+        for shift in range(max(size, 1)):
+            rotated = [2 * i for i in range(size)]
+            rotated = rotated[shift:] + rotated[:shift]
+            index = RotatedIndex(rotated)
+            queries = list(range(-1, 2 * size + 1))
+            expected = [linear_search(rotated, query) for query in queries]
+            all_passed = all_passed and (
+                index.search_many(queries) == expected
+                and index.search_many(queries[::-1]) == expected[::-1]
+                and [index.search(query) for query in queries] == expected
+                and [rotated_array_search(rotated, query) for query in queries] == expected
+            )
+    print("Pass" if all_passed else "Fail")
+    # Expected output: Pass
+
+    # Duplicates and range queries on every rotation of a buffer with repeats
+    all_passed = True
+    ring_buffer = [1, 1, 2, 2, 2, 3, 5, 5, 8]
+    for shift in range(len(ring_buffer)):
+        rotated = ring_buffer[shift:] + ring_buffer[:shift]
+        index = RotatedIndex(rotated)
+        all_passed = all_passed and index.pivot == (len(ring_buffer) - shift) % len(ring_buffer)
+        for query in range(0, 10):
+            found = rotated_array_search_with_duplicates(rotated, query)
+            hit = index.search(query)
+            all_passed = all_passed and (found == -1) == (query not in rotated)
+            all_passed = all_passed and (found == -1 or rotated[found] == query)
+            all_passed = all_passed and (hit == -1 or rotated[hit] == query) and (hit == -1) == (found == -1)
+            for high in range(query, 10):
+                expected = sorted(i for i, value in enumerate(rotated) if query <= value <= high)
+                all_passed = all_passed and sorted(index.indices_in_range(query, high)) == expected
+                all_passed = all_passed and index.count_range(query, high) == len(expected)
+    print("Pass" if all_passed else "Fail")
+    # Expected output: Pass
@@ -13,9 +13,15 @@ algorithm is correct. If necessary, add additional test cases to verify that
 your algorithm works correctly.
 """
 
+from typing import Iterable, Iterator
+
 def merge_sort(arr: list[int], descending: bool = True) -> list[int]:
     """
-    Sort the input list using merge sort.
+    Sort the input list using a bottom-up merge sort.
+
+    Runs of width 1, 2, 4, ... are merged back and forth between the list
+    and one preallocated buffer using index arithmetic only, so there are no
+    slices, no pops and no recursion.
 
     Args:
         arr (list[int]): List to be sorted
@@ -24,22 +30,51 @@ def merge_sort(arr: list[int], descending: bool = True) -> list[int]:
     Returns:
         list[int]: Sorted list
     """
-    if len(arr) <= 1:
-        return arr
+    n = len(arr)
+    source = list(arr)
+    if n <= 1:
+        return source
+    target = [0] * n
 
-    mid = len(arr) // 2
-    left = merge_sort(arr[:mid], descending)
-    right = merge_sort(arr[mid:], descending)
+    width = 1
+    while width < n:
+        for left in range(0, n, 2 * width):
+            mid = min(left + width, n)
+            right = min(left + 2 * width, n)
+            i, j = left, mid
+            for k in range(left, right):
+                # Taking from the left run on ties keeps the sort stable
+                if j >= right or (i < mid and (source[i] >= source[j] if descending else source[i] <= source[j])):
+                    target[k] = source[i]
+                    i += 1
+                else:
+                    target[k] = source[j]
+                    j += 1
+        source, target = target, source
+        width *= 2
 
-    merged = []
-    while left and right:
-        if (left[0] >= right[0]) == descending:
-            merged.append(left.pop(0))
-        else:
-            merged.append(right.pop(0))
+    return source
+
+def counting_sort(arr: list[int], descending: bool = True) -> list[int]:
+    """
+    Sort a list of digits 0-9 in O(n) by counting each digit.
+
+    Args:
+        arr (list[int]): List of integers in the range [0, 9]
+        descending (bool): If True, sort in descending order; else ascending
 
-    merged.extend(left or right)
-    return merged
+    Returns:
+        list[int]: Sorted list
+    """
+    counts = [0] * 10
+    for digit in arr:
+        counts[digit] += 1
+
+    digits = range(9, -1, -1) if descending else range(10)
+    result = []
+    for digit in digits:
+        result.extend([digit] * counts[digit])
+    return result
 
 def rearrange_digits(input_list: list[int]) -> tuple[int, int]:
     """
@@ -66,8 +101,20 @@ def rearrange_digits(input_list: list[int]) -> tuple[int, int]:
     pos_nums = [x for x in input_list if x >= 0]
     neg_nums = [x for x in input_list if x < 0]
     
+    digits_only = all(x <= 9 for x in pos_nums)
+    if digits_only and not neg_nums:
+        counts = digit_histogram(pos_nums)
+        # Several distinct digits: build both numbers from their histograms in
+        # linear time, without int(str) on very long digit strings
+        if sum(1 for count in counts if count) > 1:
+            first, second = split_histogram(counts)
+            return histogram_to_int(first), histogram_to_int(second)
+
     # Sort numbers
-    pos_nums = merge_sort(pos_nums, True)        # Sort positive numbers in descending order
+    if digits_only:
+        pos_nums = counting_sort(pos_nums, True) # Digits only: linear-time counting sort
+    else:
+        pos_nums = merge_sort(pos_nums, True)    # Sort positive numbers in descending order
     neg_nums = merge_sort(neg_nums, False)       # Sort negative numbers in ascending order
     
     # Handle special case for repeated numbers
@@ -80,6 +127,9 @@ def rearrange_digits(input_list: list[int]) -> tuple[int, int]:
     # Handle mixed positive and negative numbers
     if pos_nums and neg_nums:
         # Combine all positive numbers for the first number
+        if digits_only:
+            num2 = ''.join(map(str, map(abs, neg_nums)))
+            return (histogram_to_int(digit_histogram(pos_nums)), -int(num2))
         num1 = ''.join(map(str, pos_nums))
         # Combine all negative numbers for the second number
         num2 = ''.join(map(str, map(abs, neg_nums)))
@@ -87,13 +137,9 @@ def rearrange_digits(input_list: list[int]) -> tuple[int, int]:
     
     # Handle only positive numbers
     if pos_nums:
-        num1 = ''
-        num2 = ''
-        for i, num in enumerate(pos_nums):
-            if i % 2 == 0:
-                num1 += str(num)
-            else:
-                num2 += str(num)
+        # Alternate digits between the two numbers, joined once each
+        num1 = ''.join(map(str, pos_nums[0::2]))
+        num2 = ''.join(map(str, pos_nums[1::2]))
         return (int(num1) if num1 else 0, int(num2) if num2 else 0)
     
     # Handle only negative numbers
@@ -102,6 +148,100 @@ def rearrange_digits(input_list: list[int]) -> tuple[int, int]:
     
     return (0, 0)
 
+def digit_histogram(digits: Iterable[int]) -> list[int]:
+    """
+    Count each digit of a stream in a single pass.
+
+    Args:
+    digits (Iterable[int]): Stream of integers in the range [0, 9]
+
+    Returns:
+    list[int]: counts[d] is how many times digit d occurred
+    """
+    counts = [0] * 10
+    for digit in digits:
+        if not 0 <= digit <= 9:
+            raise ValueError("Digit streams may only contain integers 0-9.")
+        counts[digit] += 1
+    return counts
+
+def split_histogram(counts: list[int]) -> tuple[list[int], list[int]]:
+    """
+    Split a digit histogram into the histograms of the two maximal-sum numbers.
+
+    Dealing the digits in descending order alternately to the two numbers
+    gives each digit value d a run of ceil(c / 2) or floor(c / 2) copies,
+    depending on whether its run starts on an even or odd position.
+
+    Args:
+    counts (list[int]): counts[d] is how many times digit d occurred
+
+    Returns:
+    tuple[list[int], list[int]]: Digit histograms of the first and second number
+    """
+    first, second = [0] * 10, [0] * 10
+    position = 0
+    for digit in range(9, -1, -1):
+        count = counts[digit]
+        larger, smaller = (count + 1) // 2, count // 2
+        if position % 2 == 0:
+            first[digit], second[digit] = larger, smaller
+        else:
+            first[digit], second[digit] = smaller, larger
+        position += count
+    return first, second
+
+def histogram_digits(counts: list[int]) -> Iterator[int]:
+    """
+    Yield the digits of the largest number with this histogram, most significant first.
+
+    Args:
+    counts (list[int]): counts[d] is how many times digit d occurs
+
+    Returns:
+    Iterator[int]: The digits in descending order
+    """
+    for digit in range(9, -1, -1):
+        for _ in range(counts[digit]):
+            yield digit
+
+def histogram_to_int(counts: list[int]) -> int:
+    """
+    Build the largest number with this histogram without going through strings.
+
+    A run of k copies of digit d is d * (10 ** k - 1) // 9, so the number is
+    assembled from at most ten runs with big-int shifts by powers of ten.
+
+    Args:
+    counts (list[int]): counts[d] is how many times digit d occurs
+
+    Returns:
+    int: The number formed by the digits in descending order
+    """
+    number = 0
+    for digit in range(9, -1, -1):
+        count = counts[digit]
+        if count:
+            power = 10 ** count
+            number = number * power + digit * ((power - 1) // 9)
+    return number
+
+def rearrange_digit_stream(digits: Iterable[int]) -> tuple[int, int]:
+    """
+    Form the two maximal-sum numbers from a stream of digits in one pass.
+
+    Only a 10-bucket histogram is kept, so the input can be any iterable,
+    including one too large to hold in memory.
+
+    Args:
+    digits (Iterable[int]): Stream of integers in the range [0, 9]
+
+    Returns:
+    tuple[int, int]: The two numbers, the first never shorter than the second
+    """
+    first, second = split_histogram(digit_histogram(digits))
+    return histogram_to_int(first), histogram_to_int(second)
+
 def test_function(test_case: tuple[list[int], list[int]]) -> None:
     """
     Test the rearrange_digits function with a given test case.
@@ -138,3 +278,39 @@ if __name__ == '__main__':
     # Normal case: list with repeated numbers
     test_function(([2, 2, 2, 2, 2], [222, 2]))
     # Expected output: Pass
+
+    # Both sorts agree with sorted() in either order
+    import random
+    for size in range(0, 40):
+        values = [random.randint(0, 9) for _ in range(size)]
+        passed = all(
+            merge_sort(values, descending) == counting_sort(values, descending) == sorted(values, reverse=descending)
+            for descending in (True, False)
+        )
+        if not passed:
+            break
+    print("Pass" if passed else "Fail")
+    # Expected output: Pass
+
+    # Streaming variant matches the string-built answer and scales to long inputs
+    for size in range(0, 40):
+        values = [random.randint(0, 9) for _ in range(size)]
+        ordered = counting_sort(values)
+        expected = (int("".join(map(str, ordered[0::2])) or 0), int("".join(map(str, ordered[1::2])) or 0))
+        first_digits, second_digits = split_histogram(digit_histogram(values))
+        passed = (rearrange_digit_stream(iter(values)) == expected
+                  and list(histogram_digits(first_digits)) == ordered[0::2]
+                  and list(histogram_digits(second_digits)) == ordered[1::2])
+        if not passed:
+            break
+    print("Pass" if passed else "Fail")
+    # Expected output: Pass
+
+    # rearrange_digits itself handles inputs far past int(str)'s digit limit
+    values = [random.randint(0, 9) for _ in range(20000)]
+    print("Pass" if rearrange_digits(values) == rearrange_digit_stream(values) else "Fail")
+    # Expected output: Pass
+
+    long_first, long_second = rearrange_digit_stream(random.randint(0, 9) for _ in range(10 ** 6))
+    print("Pass" if long_first.bit_length() > 3 * 10 ** 6 // 2 and long_second.bit_length() > 0 else "Fail")
+    # Expected output: Pass
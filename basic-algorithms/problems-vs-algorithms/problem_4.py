@@ -14,6 +14,16 @@ correct. If necessary, add additional test cases to verify that your algorithm
 works correctly.
 """
 
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Any, Callable, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; only sort_012_numpy needs it
+    np = None
+
 def sort_012(input_list: list[int]) -> list[int]:
     """
     Sort an array consisting only of 0s, 1s, and 2s in a single traversal.
@@ -26,31 +36,170 @@ def sort_012(input_list: list[int]) -> list[int]:
     Returns:
     list[int]: The sorted list with all 0s, followed by all 1s, and then all 2s.
     """
- # Base case: if the input list is of length 1 or less, it's already sorted.
-    if len(input_list) <= 1:
-        return input_list
-    
-    # Recursive case: sort the list by moving elements to the correct position.
-    # This example works by counting 0's, 1's, and 2's.
-    
-    # Helper function to process a sublist and return sorted elements.
-    def sort_sublist(arr, index=0, zero_count=0, one_count=0, two_count=0):
-        # Base case: if we reached the end of the array, we reconstruct it.
-        if index == len(arr):
-            return [0] * zero_count + [1] * one_count + [2] * two_count
-        
-        # Recursive case: process the element at `index`.
-        if arr[index] == 0:
-            zero_count += 1
-        elif arr[index] == 1:
-            one_count += 1
+    low, mid, high = 0, 0, len(input_list) - 1
+
+    # [0, low) holds 0s, [low, mid) 1s, (high, end] 2s; [mid, high] is unseen
+    while mid <= high:
+        if input_list[mid] == 0:
+            input_list[low], input_list[mid] = input_list[mid], input_list[low]
+            low += 1
+            mid += 1
+        elif input_list[mid] == 1:
+            mid += 1
         else:
-            two_count += 1
-        
-        return sort_sublist(arr, index + 1, zero_count, one_count, two_count)
-    
-    # Start the sorting process from the first element.
-    return sort_sublist(input_list)
+            input_list[mid], input_list[high] = input_list[high], input_list[mid]
+            high -= 1
+
+    return input_list
+
+def counting_partition(input_list: list[int], keys: Sequence[int]) -> list[int]:
+    """
+    Reorder a list drawn from a few known keys, in place, in the given key order.
+
+    Counts each key in one pass, then overwrites the list run by run: O(n + k)
+    time and O(k) extra space for k distinct keys.
+
+    Args:
+    input_list (list[int]): A list whose values all appear in keys.
+    keys (Sequence[int]): The distinct keys, in the order they should appear.
+
+    Returns:
+    list[int]: The same list, grouped by key in the order of keys.
+    """
+    counts = {key: 0 for key in keys}
+    for value in input_list:
+        if value not in counts:
+            raise ValueError(f"Value {value} is not one of the partition keys.")
+        counts[value] += 1
+
+    position = 0
+    for key in keys:
+        count = counts[key]
+        input_list[position:position + count] = [key] * count
+        position += count
+    return input_list
+
+def multiway_partition(input_list: list[Any], key: Callable[[Any], int], domain_size: int) -> list[int]:
+    """
+    Partition a list in place by a small integer key (American flag sort pass).
+
+    One pass counts the bucket sizes, then each out-of-place element is
+    swapped straight into the next free slot of its bucket, so every element
+    moves at most once: O(n + k) time and O(k) extra space for k buckets.
+
+    Args:
+    input_list (list[Any]): The list to be partitioned in place.
+    key (Callable[[Any], int]): Maps an element to its bucket in [0, domain_size).
+    domain_size (int): The number of buckets.
+
+    Returns:
+    list[int]: domain_size + 1 boundaries; bucket b occupies
+    input_list[boundaries[b]:boundaries[b + 1]].
+    """
+    if domain_size <= 0:
+        raise ValueError("Domain size must be a positive integer.")
+
+    counts = [0] * domain_size
+    for value in input_list:
+        bucket = key(value)
+        if not 0 <= bucket < domain_size:
+            raise ValueError(f"Key {bucket} is outside the domain [0, {domain_size}).")
+        counts[bucket] += 1
+
+    boundaries = [0] * (domain_size + 1)
+    for bucket in range(domain_size):
+        boundaries[bucket + 1] = boundaries[bucket] + counts[bucket]
+
+    next_free = boundaries[:-1]
+    for bucket in range(domain_size):
+        end = boundaries[bucket + 1]
+        while next_free[bucket] < end:
+            index = next_free[bucket]
+            target = key(input_list[index])
+            if target == bucket:
+                next_free[bucket] += 1
+            else:
+                # Swap the element into its own bucket and re-examine this slot
+                swap_index = next_free[target]
+                input_list[index], input_list[swap_index] = input_list[swap_index], input_list[index]
+                next_free[target] += 1
+
+    return boundaries
+
+def _partition_chunk(chunk: list[Any], key: Callable[[Any], int], domain_size: int) -> tuple[list[Any], list[int]]:
+    """
+    Partition one chunk in a worker process and return it with its boundaries.
+    """
+    boundaries = multiway_partition(chunk, key, domain_size)
+    return chunk, boundaries
+
+def parallel_multiway_partition(input_list: list[Any], key: Callable[[Any], int], domain_size: int,
+                                workers: Optional[int] = None, chunk_size: int = 100000) -> list[int]:
+    """
+    Partition a list by a small integer key, partitioning chunks in parallel.
+
+    Each worker partitions one chunk and reports its bucket boundaries; the
+    per-bucket offsets are then merged and every chunk's buckets are copied
+    to their final place, chunks kept in input order. The key must be
+    picklable (a module-level function or an operator.itemgetter, not a lambda).
+
+    Args:
+    input_list (list[Any]): The list to be partitioned in place.
+    key (Callable[[Any], int]): Maps an element to its bucket in [0, domain_size).
+    domain_size (int): The number of buckets.
+    workers (Optional[int]): Number of worker processes, defaults to os.cpu_count().
+    chunk_size (int): Number of elements handed to a worker at a time.
+
+    Returns:
+    list[int]: domain_size + 1 boundaries, as for multiway_partition.
+    """
+    if chunk_size <= 0:
+        raise ValueError("Chunk size must be a positive integer.")
+
+    workers = workers or os.cpu_count() or 1
+    chunks = [input_list[start:start + chunk_size] for start in range(0, len(input_list), chunk_size)]
+    if workers == 1 or len(chunks) <= 1:
+        return multiway_partition(input_list, key, domain_size)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(_partition_chunk, chunks, repeat(key), repeat(domain_size)))
+
+    # Bucket b starts after every element of buckets 0..b-1 across all chunks
+    boundaries = [0] * (domain_size + 1)
+    for bucket in range(domain_size):
+        bucket_size = sum(chunk_bounds[bucket + 1] - chunk_bounds[bucket] for _, chunk_bounds in results)
+        boundaries[bucket + 1] = boundaries[bucket] + bucket_size
+
+    write_position = boundaries[:-1]
+    for chunk, chunk_bounds in results:
+        for bucket in range(domain_size):
+            start, end = chunk_bounds[bucket], chunk_bounds[bucket + 1]
+            input_list[write_position[bucket]:write_position[bucket] + end - start] = chunk[start:end]
+            write_position[bucket] += end - start
+
+    return boundaries
+
+def sort_012_numpy(input_array: "np.ndarray") -> "np.ndarray":
+    """
+    Sort a NumPy array of 0s, 1s and 2s in place with vectorized counting.
+
+    Args:
+    input_array (np.ndarray): A one-dimensional integer array of 0s, 1s and 2s.
+
+    Returns:
+    np.ndarray: The same array, sorted.
+    """
+    if np is None:
+        raise ImportError("sort_012_numpy requires NumPy.")
+
+    counts = np.bincount(input_array, minlength=3)
+    if len(counts) > 3:
+        raise ValueError("Array may only contain 0, 1 and 2.")
+    zeros, ones = counts[0], counts[1]
+    input_array[:zeros] = 0
+    input_array[zeros:zeros + ones] = 1
+    input_array[zeros + ones:] = 2
+    return input_array
 
 def test_function(test_case: list[list[int]]) -> None:
     """
@@ -65,7 +214,7 @@ def test_function(test_case: list[list[int]]) -> None:
     None: Prints the sorted array and "Pass" if the output from sort_012 
     matches the sorted input array, otherwise prints "Fail".
     """
-    sorted_array: list[int] = sort_012(test_case[0])
+    sorted_array: list[int] = sort_012(list(test_case[0]))
     print(sorted_array)
     if sorted_array == sorted(test_case[0]):
         print("Pass")
@@ -88,3 +237,33 @@ if __name__ == "__main__":
     # Normal case: Reverse sorted list
     test_function([[2, 2, 1, 1, 0, 0]])
     # Expected output: Pass
+
+    # Large inputs no longer hit the recursion limit, and every variant agrees
+    import random
+    values = [random.randint(0, 2) for _ in range(100000)]
+    expected = sorted(values)
+    results = [sort_012(list(values)), counting_partition(list(values), (0, 1, 2))]
+    if np is not None:
+        results.append(sort_012_numpy(np.array(values)).tolist())
+    print("Pass" if all(result == expected for result in results) else "Fail")
+    # Expected output: Pass
+
+    # Counting partition with a custom key order
+    print("Pass" if counting_partition([3, 1, 2, 1, 3], (3, 2, 1)) == [3, 3, 2, 1, 1] else "Fail")
+    # Expected output: Pass
+
+    # Multi-way partition by a key function, sequential and parallel
+    from operator import itemgetter
+    records = [(random.randrange(5), i) for i in range(50000)]
+    for partition in (multiway_partition, parallel_multiway_partition):
+        partitioned = list(records)
+        if partition is parallel_multiway_partition:
+            bounds = partition(partitioned, itemgetter(0), 5, workers=2, chunk_size=8000)
+        else:
+            bounds = partition(partitioned, itemgetter(0), 5)
+        passed = (sorted(partitioned) == sorted(records)
+                  and all(partitioned[i][0] == bucket
+                          for bucket in range(5) for i in range(bounds[bucket], bounds[bucket + 1]))
+                  and bounds[-1] == len(records))
+        print("Pass" if passed else "Fail")
+        # Expected output: Pass
@@ -1,3 +1,6 @@
+from array import array
+from typing import Iterable, Iterator, Optional, Union
+
 class Group:
     """
     A class to represent a group which can contain sub-groups and users.
@@ -81,6 +84,352 @@ class Group:
         return self.name
 
 
+class UserRegistry:
+    """
+    A shared intern table mapping user strings to dense integer IDs.
+
+    Every user string is stored exactly once here; groups that use the registry
+    only keep compressed sets of these IDs.
+
+    Attributes:
+    -----------
+    ids : dict[str, int]
+        Mapping from user string to its interned ID.
+    names : list[str]
+        Mapping from interned ID back to the user string.
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructs an empty intern table.
+        """
+        self.ids: dict[str, int] = {}
+        self.names: list[str] = []
+
+    def intern(self, user: str) -> int:
+        """
+        Return the ID of a user, assigning the next free ID on first sight.
+
+        Parameters:
+        -----------
+        user : str
+            The user to be interned.
+
+        Returns:
+        --------
+        int
+            The interned ID of the user.
+        """
+        user_id = self.ids.get(user)
+        if user_id is None:
+            user_id = len(self.names)
+            self.ids[user] = user_id
+            self.names.append(user)
+        return user_id
+
+    def lookup(self, user: str) -> Optional[int]:
+        """
+        Return the ID of a user without interning it.
+
+        Parameters:
+        -----------
+        user : str
+            The user to be looked up.
+
+        Returns:
+        --------
+        Optional[int]
+            The interned ID, or None if the user was never interned.
+        """
+        return self.ids.get(user)
+
+    def decode(self, user_ids: Iterable[int]) -> list[str]:
+        """
+        Expand interned IDs back into user strings.
+
+        Parameters:
+        -----------
+        user_ids : Iterable[int]
+            Interned user IDs, such as a UserSet.
+
+        Returns:
+        --------
+        list[str]
+            The users with those IDs, in iteration order.
+        """
+        return [self.names[user_id] for user_id in user_ids]
+
+
+class UserSet:
+    """
+    A compressed set of interned user IDs, split into chunks of 65536 IDs.
+
+    Chunks are keyed by ``user_id >> 16``. A chunk with few members is a sorted
+    ``array('H')`` of the low 16 bits; once it holds more than
+    ``ARRAY_LIMIT`` members it becomes an int bitmap of at most 8 KiB. Memory
+    therefore follows the number of members rather than the highest ID, and
+    no single operation touches more than one chunk's worth of bits.
+
+    Attributes:
+    -----------
+    chunks : dict[int, array | int]
+        Mapping from chunk key to its sorted array or bitmap container.
+    """
+
+    CHUNK_BITS = 16
+    ARRAY_LIMIT = 4096
+
+    def __init__(self) -> None:
+        """
+        Constructs an empty set.
+        """
+        self.chunks: dict[int, Union[array, int]] = {}
+
+    def add(self, user_id: int) -> None:
+        """
+        Add an ID to the set.
+
+        Parameters:
+        -----------
+        user_id : int
+            The interned ID to be added.
+        """
+        key, low = user_id >> self.CHUNK_BITS, user_id & 0xFFFF
+        container = self.chunks.get(key)
+        if container is None:
+            self.chunks[key] = array('H', [low])
+        elif isinstance(container, int):
+            self.chunks[key] = container | (1 << low)
+        else:
+            position = self._bisect(container, low)
+            if position < len(container) and container[position] == low:
+                return
+            container.insert(position, low)
+            if len(container) > self.ARRAY_LIMIT:
+                self.chunks[key] = self._to_bitmap(container)
+
+    def update(self, other: 'UserSet') -> None:
+        """
+        Add every ID of another set, merging chunk by chunk.
+
+        Parameters:
+        -----------
+        other : UserSet
+            The set whose members are added.
+        """
+        for key, theirs in other.chunks.items():
+            mine = self.chunks.get(key)
+            if mine is None:
+                self.chunks[key] = theirs if isinstance(theirs, int) else array('H', theirs)
+            elif isinstance(mine, int) or isinstance(theirs, int):
+                self.chunks[key] = self._to_bitmap(mine) | self._to_bitmap(theirs)
+            else:
+                merged = array('H', sorted(set(mine).union(theirs)))
+                self.chunks[key] = self._to_bitmap(merged) if len(merged) > self.ARRAY_LIMIT else merged
+
+    def copy(self) -> 'UserSet':
+        """
+        Return a copy that does not share mutable containers with this set.
+
+        Returns:
+        --------
+        UserSet
+            A new set with the same members.
+        """
+        result = UserSet()
+        result.update(self)
+        return result
+
+    def __contains__(self, user_id: int) -> bool:
+        container = self.chunks.get(user_id >> self.CHUNK_BITS)
+        if container is None:
+            return False
+        low = user_id & 0xFFFF
+        if isinstance(container, int):
+            return (container >> low) & 1 == 1
+        position = self._bisect(container, low)
+        return position < len(container) and container[position] == low
+
+    def __iter__(self) -> Iterator[int]:
+        for key in sorted(self.chunks):
+            base = key << self.CHUNK_BITS
+            container = self.chunks[key]
+            if isinstance(container, int):
+                while container:
+                    low_bit = container & -container
+                    yield base + low_bit.bit_length() - 1
+                    container ^= low_bit
+            else:
+                for low in container:
+                    yield base + low
+
+    def __len__(self) -> int:
+        return sum(container.bit_count() if isinstance(container, int) else len(container)
+                   for container in self.chunks.values())
+
+    @staticmethod
+    def _bisect(container: array, value: int) -> int:
+        """
+        Return the leftmost position at which value could be inserted.
+        """
+        low, high = 0, len(container)
+        while low < high:
+            mid = (low + high) // 2
+            if container[mid] < value:
+                low = mid + 1
+            else:
+                high = mid
+        return low
+
+    @staticmethod
+    def _to_bitmap(container: Union[array, int]) -> int:
+        """
+        Convert a sorted array container to an int bitmap.
+        """
+        if isinstance(container, int):
+            return container
+        buffer = bytearray(8192)
+        for low in container:
+            buffer[low >> 3] |= 1 << (low & 7)
+        return int.from_bytes(buffer, 'little')
+
+
+class BitsetGroup(Group):
+    """
+    A Group that stores membership as UserSets over a shared UserRegistry.
+
+    Direct membership is kept in ``user_ids``. Effective membership (the
+    group plus all of its sub-groups) is the union of the direct sets and is
+    cached until this group or any descendant changes.
+
+    Attributes:
+    -----------
+    registry : UserRegistry
+        The intern table shared by all groups of the hierarchy.
+    user_ids : UserSet
+        Interned IDs of users added directly to this group.
+    parents : list[BitsetGroup]
+        Groups that contain this group, used to invalidate cached results.
+    """
+
+    def __init__(self, _name: str, registry: UserRegistry) -> None:
+        """
+        Constructs all the necessary attributes for the BitsetGroup object.
+
+        Parameters:
+        -----------
+        _name : str
+            The name of the group.
+        registry : UserRegistry
+            The intern table shared by all groups of the hierarchy.
+        """
+        super().__init__(_name)
+        self.registry: UserRegistry = registry
+        self.user_ids: UserSet = UserSet()
+        self.parents: list[BitsetGroup] = []
+        self._effective_ids: Optional[UserSet] = None
+
+    def add_group(self, group: 'Group') -> None:
+        """
+        Add a sub-group to this group.
+
+        Parameters:
+        -----------
+        group : BitsetGroup
+            The sub-group to be added. It must share this group's registry.
+        """
+        if not isinstance(group, BitsetGroup) or group.registry is not self.registry:
+            raise ValueError("Sub-group must be a BitsetGroup sharing the same registry")
+        super().add_group(group)
+        group.parents.append(self)
+        self._invalidate()
+
+    def add_user(self, user: str) -> None:
+        """
+        Add a user to this group.
+
+        Parameters:
+        -----------
+        user : str
+            The user to be added.
+        """
+        self.user_ids.add(self.registry.intern(user))
+        self._invalidate()
+
+    def get_users(self) -> list[str]:
+        """
+        Get the list of users added directly to this group.
+
+        Returns:
+        --------
+        list[str]
+            A list of users, in interned ID order.
+        """
+        return self.registry.decode(self.user_ids)
+
+    def effective_ids(self) -> UserSet:
+        """
+        Get the IDs of users in this group or any of its sub-groups.
+
+        Returns:
+        --------
+        UserSet
+            The union of the direct sets of the whole sub-hierarchy.
+        """
+        if self._effective_ids is not None:
+            return self._effective_ids
+
+        user_ids = UserSet()
+        visited = set()
+        stack = [self]
+        while stack:
+            current_group = stack.pop()
+            if id(current_group) in visited:
+                continue
+            visited.add(id(current_group))
+            if current_group._effective_ids is not None:
+                user_ids.update(current_group._effective_ids)
+                continue
+            user_ids.update(current_group.user_ids)
+            stack.extend(current_group.groups)
+
+        self._effective_ids = user_ids
+        return user_ids
+
+    def has_member(self, user: str) -> bool:
+        """
+        Check if a user is in this group or any of its sub-groups.
+
+        Parameters:
+        -----------
+        user : str
+            The user to be checked.
+
+        Returns:
+        --------
+        bool
+            True if the user's ID is in the effective membership.
+        """
+        user_id = self.registry.lookup(user)
+        if user_id is None:
+            return False
+        return user_id in self.effective_ids()
+
+    def _invalidate(self) -> None:
+        """
+        Drop the cached effective membership of this group and its ancestors.
+        """
+        visited = set()
+        stack = [self]
+        while stack:
+            current_group = stack.pop()
+            if id(current_group) in visited:
+                continue
+            visited.add(id(current_group))
+            current_group._effective_ids = None
+            stack.extend(current_group.parents)
+
+
 def is_user_in_group(user: str, group: Group) -> bool:
     """
     Check if a user is in the given group or any of its sub-groups.
@@ -100,6 +449,10 @@ def is_user_in_group(user: str, group: Group) -> bool:
     if user is None:
         return False
 
+    # Interned groups answer with one lookup in the cached union
+    if isinstance(group, BitsetGroup):
+        return group.has_member(user)
+
     # Use a stack to implement an iterative depth-first search
     stack = [group]
 
@@ -150,3 +503,31 @@ if __name__ == "__main__":
     print("\nTest Case 5: Empty group structure")
     empty_group = Group("empty")
     print(is_user_in_group("any_user", empty_group))  # Expected output: False
+
+    # Test Case 6: Interned bitset groups
+    print("\nTest Case 6: Interned bitset groups")
+    registry = UserRegistry()
+    bit_parent = BitsetGroup("parent", registry)
+    bit_child = BitsetGroup("child", registry)
+    bit_sub_child = BitsetGroup("subchild", registry)
+    bit_sub_child.add_user("sub_child_user")
+    bit_child.add_group(bit_sub_child)
+    bit_parent.add_group(bit_child)
+    print(is_user_in_group("sub_child_user", bit_parent))  # Expected output: True
+    print(is_user_in_group("nonexistent_user", bit_parent))  # Expected output: False
+
+    # Adding a user below a cached group must invalidate the cache
+    bit_sub_child.add_user("late_user")
+    print(is_user_in_group("late_user", bit_parent))  # Expected output: True
+    print(bit_parent.registry.decode(bit_parent.effective_ids()))  # Expected output: ['sub_child_user', 'late_user']
+
+    # Test Case 7: Sparse and dense chunks
+    print("\nTest Case 7: Sparse and dense chunks")
+    sparse = UserSet()
+    sparse.add(5_000_000)
+    dense = UserSet()
+    for user_id in range(0, 10_000, 2):
+        dense.add(user_id)
+    print(isinstance(sparse.chunks[5_000_000 >> 16], array), isinstance(dense.chunks[0], int))  # Expected output: True True
+    dense.update(sparse)
+    print(5_000_000 in dense, 9_998 in dense, 9_999 in dense, len(dense))  # Expected output: True True False 5001
@@ -1,6 +1,136 @@
 import hashlib
 import datetime
-from typing import Optional
+import mmap
+import os
+import queue
+import struct
+import threading
+import time
+import tracemalloc
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Callable, Iterator, Optional
+
+def hash_block_fields(timestamp: object, data: object, previous_hash: object) -> str:
+    """Calculate the SHA-256 hex digest of a block's fields."""
+    sha = hashlib.sha256()
+    hash_str = (str(timestamp) + str(data) + str(previous_hash)).encode('utf-8')
+    sha.update(hash_str)
+    return sha.hexdigest()
+
+def hash_compact_fields(timestamp: int, data: object, previous_digest: bytes) -> bytes:
+    """Calculate the raw SHA-256 digest of a compact block's fields."""
+    sha = hashlib.sha256()
+    sha.update(struct.pack("<q", timestamp))
+    sha.update(str(data).encode('utf-8'))
+    sha.update(previous_digest)
+    return sha.digest()
+
+def verify_block_range(start: int, records: list[tuple], hasher: Callable = hash_block_fields) -> Optional[str]:
+    """
+    Re-hash a contiguous range of blocks and check the links inside it.
+
+    Parameters:
+    -----------
+    start : int
+        The chain index of the first record in the range.
+    records : list[tuple]
+        (timestamp, data, previous_hash, hash, transactions) tuples for the
+        range; transactions is None except for batch blocks, whose Merkle
+        root is rebuilt here and compared with the data.
+    hasher : Callable
+        The module-level function that hashes a record's first three fields.
+
+    Returns:
+    --------
+    Optional[str]
+        Error message for the first problem found, None if the range is valid.
+    """
+    for offset, (timestamp, data, previous_hash, block_hash, transactions) in enumerate(records):
+        block_index = start + offset
+        if block_hash != hasher(timestamp, data, previous_hash):
+            return f"Invalid hash in block {block_index}"
+        if transactions is not None and compute_merkle_root(transactions).hex() != data:
+            return f"Merkle root mismatch in block {block_index}"
+        if offset + 1 < len(records) and block_hash != records[offset + 1][2]:
+            return f"Chain broken between blocks {block_index} and {block_index + 1}"
+    return None
+
+def hash_merkle_leaf(transaction: str) -> bytes:
+    """Hash a transaction as a Merkle leaf, domain-separated from inner nodes."""
+    return hashlib.sha256(b"\x00" + str(transaction).encode('utf-8')).digest()
+
+def hash_merkle_node(left: bytes, right: bytes) -> bytes:
+    """Hash two child digests into their parent Merkle node."""
+    return hashlib.sha256(b"\x01" + left + right).digest()
+
+def build_merkle_levels(transactions: list[str]) -> list[list[bytes]]:
+    """
+    Build every level of a Merkle tree, from the leaves up to the root.
+
+    An odd node at the end of a level is promoted unchanged rather than
+    paired with a copy of itself, so no two transaction lists share a root.
+
+    Parameters:
+    -----------
+    transactions : list[str]
+        The transactions forming the leaves.
+
+    Returns:
+    --------
+    list[list[bytes]]
+        The tree levels; the last level holds only the root.
+    """
+    level = merkle_leaves(transactions)
+    levels = [level]
+    while len(level) > 1:
+        level = merkle_parents(level)
+        levels.append(level)
+    return levels
+
+def merkle_leaves(transactions: list[str]) -> list[bytes]:
+    """Hash the transactions into the bottom level of a Merkle tree."""
+    return [hash_merkle_leaf(transaction) for transaction in transactions] or [hashlib.sha256(b"").digest()]
+
+def merkle_parents(level: list[bytes]) -> list[bytes]:
+    """Hash one Merkle level into the next, promoting an odd last node."""
+    parents = [hash_merkle_node(level[i], level[i + 1]) for i in range(0, len(level) - 1, 2)]
+    if len(level) % 2 == 1:
+        parents.append(level[-1])
+    return parents
+
+def compute_merkle_root(transactions: list[str]) -> bytes:
+    """Compute only the Merkle root, keeping one level in memory at a time."""
+    level = merkle_leaves(transactions)
+    while len(level) > 1:
+        level = merkle_parents(level)
+    return level[0]
+
+def verify_merkle_proof(transaction: str, proof: list[tuple[str, bool]], merkle_root: str) -> bool:
+    """
+    Check that a transaction is included under a Merkle root.
+
+    Parameters:
+    -----------
+    transaction : str
+        The transaction to be checked.
+    proof : list[tuple[str, bool]]
+        (sibling hex digest, sibling is on the left) pairs from leaf to root.
+    merkle_root : str
+        The hex Merkle root taken from the block header.
+
+    Returns:
+    --------
+    bool
+        True if hashing up the proof reproduces the root, False otherwise.
+    """
+    digest = hash_merkle_leaf(transaction)
+    for sibling, sibling_is_left in proof:
+        sibling_digest = bytes.fromhex(sibling)
+        if sibling_is_left:
+            digest = hash_merkle_node(sibling_digest, digest)
+        else:
+            digest = hash_merkle_node(digest, sibling_digest)
+    return digest.hex() == merkle_root
 
 class Block:
     """
@@ -13,12 +143,24 @@ class Block:
         self.hash: str = self.calc_hash()
         self.next: Optional[Block] = None  # LinkedList next pointer
 
+    @classmethod
+    def from_fields(cls, timestamp: datetime.datetime, data: str, previous_hash: str, block_hash: str) -> 'Block':
+        """Rebuild a stored block without recomputing (and so trusting) its hash."""
+        block = cls.__new__(cls)
+        block.timestamp = timestamp
+        block.data = data
+        block.previous_hash = previous_hash
+        block.hash = block_hash
+        block.next = None
+        return block
+
     def calc_hash(self) -> str:
         """Calculate the hash of the block using SHA-256."""
-        sha = hashlib.sha256()
-        hash_str = (str(self.timestamp) + str(self.data) + str(self.previous_hash)).encode('utf-8')
-        sha.update(hash_str)
-        return sha.hexdigest()
+        return hash_block_fields(self.timestamp, self.data, self.previous_hash)
+
+    def hash_record(self) -> tuple:
+        """Return the (timestamp, data, previous_hash, hash, transactions) fields checked by audits."""
+        return (self.timestamp, self.data, self.previous_hash, self.hash, None)
 
     def __repr__(self) -> str:
         """Return a string representation of the block."""
@@ -29,15 +171,106 @@ class Block:
                 f"  Hash: {self.hash}\n"
                 f")\n")
 
+class MerkleBatch:
+    """
+    Merkle-root behaviour shared by batch blocks of both chain representations.
+
+    Subclasses set ``transactions`` and store the hex root as their data, so
+    the header hash covers the root only. The tree levels are built on the
+    first proof request and kept in ``levels``.
+    """
+    __slots__ = ()
+
+    @property
+    def merkle_root(self) -> str:
+        """Return the hex Merkle root of the transactions."""
+        return self.data
+
+    def verify_merkle_root(self) -> bool:
+        """Rebuild the root from the transactions and compare it with the header."""
+        return compute_merkle_root(self.transactions).hex() == self.data
+
+    def hash_record(self) -> tuple:
+        """Return the (timestamp, data, previous hash, hash, transactions) fields checked by audits."""
+        return super().hash_record()[:4] + (self.transactions,)
+
+    def proof(self, index: int) -> list[tuple[str, bool]]:
+        """
+        Build the inclusion proof for one transaction.
+
+        Parameters:
+        -----------
+        index : int
+            The position of the transaction in the batch.
+
+        Returns:
+        --------
+        list[tuple[str, bool]]
+            (sibling hex digest, sibling is on the left) pairs from leaf to root,
+            O(log n) entries long.
+        """
+        if index < 0 or index >= len(self.transactions):
+            raise IndexError("Transaction index out of range")
+
+        if self.levels is None:
+            self.levels = build_merkle_levels(self.transactions)
+
+        proof = []
+        for level in self.levels[:-1]:
+            sibling = index ^ 1
+            # A promoted odd node has no sibling on this level
+            if sibling < len(level):
+                proof.append((level[sibling].hex(), sibling < index))
+            index //= 2
+        return proof
+
+class BatchBlock(MerkleBatch, Block):
+    """
+    A block holding many transactions under a Merkle root.
+
+    The block hash covers only the header (timestamp, Merkle root and
+    previous hash), so the root is stored as the block's data and the block
+    links like a plain Block. Validation also rebuilds the root from the
+    transactions, so tampering with either one invalidates the block.
+    """
+    def __init__(self, timestamp: datetime.datetime, transactions: list[str], previous_hash: str) -> None:
+        self.transactions: list[str] = list(transactions)
+        self.levels: Optional[list[list[bytes]]] = None
+        super().__init__(timestamp, compute_merkle_root(self.transactions).hex(), previous_hash)
+
+    @classmethod
+    def from_fields(cls, timestamp: datetime.datetime, data: str, previous_hash: str, block_hash: str,
+                    transactions: tuple[str, ...] = ()) -> 'BatchBlock':
+        """Rebuild a stored batch block without hashing its transactions."""
+        block = super().from_fields(timestamp, data, previous_hash, block_hash)
+        block.transactions = list(transactions)
+        block.levels = None
+        return block
+
+    def __repr__(self) -> str:
+        """Return a string representation of the block."""
+        return (f"BatchBlock(\n"
+                f"  Timestamp: {self.timestamp},\n"
+                f"  Transactions: {len(self.transactions)},\n"
+                f"  Merkle Root: {self.merkle_root},\n"
+                f"  Previous Hash: {self.previous_hash},\n"
+                f"  Hash: {self.hash}\n"
+                f")\n")
+
 class Blockchain:
     """
     A class to represent a blockchain using LinkedList structure.
     """
+    block_hasher = staticmethod(hash_block_fields)  # Re-hashes hash_record() fields in audits
+
     def __init__(self) -> None:
         """Initialize an empty blockchain."""
         self.head: Optional[Block] = None
         self.tail: Optional[Block] = None
         self.length: int = 0
+        self.blocks: list[Block] = []  # Positional index for O(1) lookup
+        self.hash_index: dict[object, Block] = {}  # Hash (raw digest for compact chains) to block index
+        self.verified_height: int = 0  # Number of leading blocks already validated
         self.create_genesis_block()
 
     def create_genesis_block(self) -> None:
@@ -50,6 +283,9 @@ class Blockchain:
         self.head = genesis_block
         self.tail = genesis_block
         self.length = 1
+        self.blocks = [genesis_block]
+        self.hash_index = {genesis_block.hash: genesis_block}
+        self.verified_height = 0
 
     def add_block(self, data: str) -> None:
         """
@@ -64,17 +300,90 @@ class Blockchain:
             self.create_genesis_block()
             return
 
-        new_block = Block(
+        self.append_block(self.make_block(data))
+
+    def make_block(self, data: str) -> Block:
+        """
+        Build, without appending, a block that follows the current tail.
+
+        Subclasses override this to choose their block type; add_block and
+        BlockIngestor both build blocks through it.
+
+        Parameters:
+        -----------
+        data : str
+            The data to be stored in the new block.
+
+        Returns:
+        --------
+        Block
+            A new block stamped now and linked to the tail's hash.
+        """
+        return Block(
             timestamp=datetime.datetime.now(),
             data=data,
             previous_hash=self.tail.hash
         )
-        
+
+    def make_batch(self, transactions: list[str]) -> 'BatchBlock':
+        """
+        Build, without appending, a batch block that follows the current tail.
+
+        Parameters:
+        -----------
+        transactions : list[str]
+            The transactions to be stored in the new block.
+
+        Returns:
+        --------
+        BatchBlock
+            A new batch block stamped now and linked to the tail's hash.
+        """
+        return BatchBlock(
+            timestamp=datetime.datetime.now(),
+            transactions=transactions,
+            previous_hash=self.tail.hash
+        )
+
+    def add_batch(self, transactions: list[str]) -> MerkleBatch:
+        """
+        Add a block holding many transactions under a single Merkle root.
+
+        Parameters:
+        -----------
+        transactions : list[str]
+            The transactions to be stored in the new block.
+
+        Returns:
+        --------
+        MerkleBatch
+            The new block, which can produce inclusion proofs.
+        """
+        if not self.tail:
+            self.create_genesis_block()
+
+        batch_block = self.make_batch(transactions)
+        self.append_block(batch_block)
+        return batch_block
+
+    def append_block(self, new_block: Block) -> None:
+        """
+        Link an already-built block onto the tail of the chain.
+
+        Parameters:
+        -----------
+        new_block : Block
+            The block to be appended. Its previous_hash must match the tail.
+        """
         # Update LinkedList pointers
         self.tail.next = new_block
         self.tail = new_block
         self.length += 1
 
+        # Keep the auxiliary indexes current
+        self.blocks.append(new_block)
+        self.hash_index[new_block.hash] = new_block
+
     def get_block_at_index(self, index: int) -> Optional[Block]:
         """
         Get block at specific index.
@@ -92,20 +401,65 @@ class Blockchain:
         if index < 0 or index >= self.length:
             return None
 
-        current = self.head
-        for _ in range(index):
-            if current:
-                current = current.next
-        return current
+        return self.blocks[index]
 
-    def __repr__(self) -> str:
-        """Return a string representation of the blockchain."""
-        chain_str = ""
+    def get_block_by_hash(self, block_hash: str) -> Optional[Block]:
+        """
+        Get block by its hash.
+
+        Parameters:
+        -----------
+        block_hash : str
+            The hex digest of the block to retrieve.
+
+        Returns:
+        --------
+        Optional[Block]
+            The block with the given hash or None if no such block exists.
+        """
+        return self.hash_index.get(block_hash)
+
+    def __iter__(self) -> Iterator[Block]:
+        """Iterate over the blocks from genesis to tail."""
         current = self.head
         while current:
-            chain_str += str(current) + "\n"
+            yield current
             current = current.next
-        return chain_str
+
+    def __repr__(self) -> str:
+        """Return a string representation of the blockchain."""
+        return "".join(str(block) + "\n" for block in self)
+
+    def check_block(self, block_index: int, previous_block: Optional[Block], block: Block) -> Optional[str]:
+        """
+        Check one block's link, hash and, for batch blocks, Merkle root.
+
+        Parameters:
+        -----------
+        block_index : int
+            The position of the block, used in error messages.
+        previous_block : Optional[Block]
+            The block before it, or None if its link is not checked.
+        block : Block
+            The block to be checked.
+
+        Returns:
+        --------
+        Optional[str]
+            Error message for the first problem found, None if the block is valid.
+        """
+        # Validate link between previous block and current block
+        if previous_block is not None and previous_block.hash != block.previous_hash:
+            return f"Chain broken between blocks {block_index - 1} and {block_index}"
+
+        # Validate current block's hash
+        if block.hash != block.calc_hash():
+            return f"Invalid hash in block {block_index}"
+
+        # The header hash covers only the root, so re-check it against the transactions
+        if isinstance(block, MerkleBatch) and not block.verify_merkle_root():
+            return f"Merkle root mismatch in block {block_index}"
+        return None
 
     def validate_chain(self) -> tuple[bool, Optional[str]]:
         """
@@ -118,30 +472,738 @@ class Blockchain:
             - bool: True if the chain is valid, False otherwise
             - Optional[str]: Error message if validation fails, None if successful
         """
-        if not self.head:
-            return True, None
+        previous_block = None
+        for block_index, current_block in enumerate(self):
+            error = self.check_block(block_index, previous_block, current_block)
+            if error is not None:
+                return False, error
+            previous_block = current_block
 
-        current_block = self.head
-        block_index = 0
+        self.verified_height = self.length
+        return True, None
 
-        while current_block.next:
-            # Validate current block's hash
-            if current_block.hash != current_block.calc_hash():
-                return False, f"Invalid hash in block {block_index}"
+    def validate_new_blocks(self) -> tuple[bool, Optional[str]]:
+        """
+        Validate only the blocks added since the last successful validation.
 
-            # Validate link between current block and next block
-            if current_block.hash != current_block.next.previous_hash:
-                return False, f"Chain broken between blocks {block_index} and {block_index + 1}"
+        The last verified block is used as the anchor for the link check, so
+        each block is re-hashed once over the lifetime of the chain. Blocks
+        below the checkpoint are trusted; use audit_chain to re-check them.
 
-            current_block = current_block.next
-            block_index += 1
+        Returns:
+        --------
+        Tuple[bool, Optional[str]]
+            A tuple containing:
+            - bool: True if the new blocks are valid, False otherwise
+            - Optional[str]: Error message if validation fails, None if successful
+        """
+        start = self.verified_height
+        previous_block = self.get_block_at_index(start - 1)
+        for block_index in range(start, self.length):
+            block = self.get_block_at_index(block_index)
+            error = self.check_block(block_index, previous_block, block)
+            if error is not None:
+                return False, error
+            previous_block = block
+            # Advance the checkpoint as we go so a later failure keeps progress
+            self.verified_height = block_index + 1
+
+        return True, None
+
+    def audit_chain(self, workers: Optional[int] = None, chunk_size: int = 50000) -> tuple[bool, Optional[str]]:
+        """
+        Re-hash the whole chain, splitting it into ranges checked in a process pool.
 
-        # Validate the last block's hash
-        if current_block.hash != current_block.calc_hash():
-            return False, f"Invalid hash in block {block_index}"
+        Each worker validates hashes and links inside its range; the links
+        between neighbouring ranges are checked here.
 
+        Parameters:
+        -----------
+        workers : Optional[int]
+            Number of worker processes, defaults to os.cpu_count().
+        chunk_size : int
+            Number of blocks handed to a worker at a time.
+
+        Returns:
+        --------
+        Tuple[bool, Optional[str]]
+            A tuple containing:
+            - bool: True if the chain is valid, False otherwise
+            - Optional[str]: Error message if validation fails, None if successful
+        """
+        if chunk_size <= 0:
+            raise ValueError("Chunk size must be a positive integer")
+
+        workers = workers or os.cpu_count() or 1
+        starts = list(range(0, self.length, chunk_size))
+        ranges = [[] for _ in starts]
+        for block_index, block in enumerate(self):
+            ranges[block_index // chunk_size].append(block.hash_record())
+
+        if workers == 1 or len(ranges) <= 1:
+            errors = [verify_block_range(start, records, self.block_hasher) for start, records in zip(starts, ranges)]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                hashers = [self.block_hasher] * len(ranges)
+                errors = list(executor.map(verify_block_range, starts, ranges, hashers))
+
+        # Walk the ranges in chain order, checking the link into each range
+        # (not visible to the workers) before its own errors, so the first
+        # problem reported matches validate_chain
+        for range_index, error in enumerate(errors):
+            start = starts[range_index]
+            if range_index > 0 and ranges[range_index - 1][-1][3] != ranges[range_index][0][2]:
+                return False, f"Chain broken between blocks {start - 1} and {start}"
+            if error is not None:
+                return False, error
+
+        self.verified_height = self.length
         return True, None
 
+class CompactBlock:
+    """
+    A memory-lean block: no __dict__, raw 32-byte digests and an integer
+    timestamp in microseconds since the epoch. Hex strings and datetimes are
+    only produced on demand for display.
+    """
+    __slots__ = ("timestamp", "data", "previous_digest", "digest", "next")
+
+    def __init__(self, timestamp: int, data: str, previous_digest: bytes) -> None:
+        self.timestamp: int = timestamp
+        self.data: str = data
+        self.previous_digest: bytes = previous_digest
+        self.digest: bytes = self.calc_digest()
+        self.next: Optional[CompactBlock] = None  # LinkedList next pointer
+
+    def calc_digest(self) -> bytes:
+        """Calculate the raw SHA-256 digest of the block."""
+        return hash_compact_fields(self.timestamp, self.data, self.previous_digest)
+
+    def calc_hash(self) -> str:
+        """Calculate the hex hash of the block, for code expecting Block's API."""
+        return self.calc_digest().hex()
+
+    @property
+    def hash(self) -> str:
+        """Return the block's digest as hex."""
+        return self.digest.hex()
+
+    @property
+    def previous_hash(self) -> str:
+        """Return the previous block's digest as hex."""
+        return self.previous_digest.hex()
+
+    def hash_record(self) -> tuple:
+        """Return the (timestamp, data, previous_digest, digest, transactions) fields checked by audits."""
+        return (self.timestamp, self.data, self.previous_digest, self.digest, None)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the block."""
+        timestamp = datetime.datetime.fromtimestamp(self.timestamp / 1_000_000)
+        return (f"CompactBlock(\n"
+                f"  Timestamp: {timestamp},\n"
+                f"  Data: {self.data},\n"
+                f"  Previous Hash: {self.previous_hash},\n"
+                f"  Hash: {self.hash}\n"
+                f")\n")
+
+class CompactBatchBlock(MerkleBatch, CompactBlock):
+    """
+    A CompactBlock holding many transactions under a Merkle root, which is
+    stored as its data and rebuilt from the transactions on validation.
+    """
+    __slots__ = ("transactions", "levels")
+
+    def __init__(self, timestamp: int, transactions: list[str], previous_digest: bytes) -> None:
+        self.transactions: list[str] = list(transactions)
+        self.levels: Optional[list[list[bytes]]] = None
+        super().__init__(timestamp, compute_merkle_root(self.transactions).hex(), previous_digest)
+
+class CompactBlockchain(Blockchain):
+    """
+    A blockchain of CompactBlock objects, indexed by raw digest.
+    """
+    block_hasher = staticmethod(hash_compact_fields)
+
+    def create_genesis_block(self) -> None:
+        """Create the genesis block (the first block in the blockchain)."""
+        genesis_block = CompactBlock(
+            timestamp=time.time_ns() // 1000,
+            data="Genesis Block",
+            previous_digest=bytes(32)
+        )
+        self.head = genesis_block
+        self.tail = genesis_block
+        self.length = 1
+        self.blocks = [genesis_block]
+        self.hash_index = {genesis_block.digest: genesis_block}
+        self.verified_height = 0
+
+    def check_block(self, block_index: int, previous_block: Optional[CompactBlock],
+                    block: CompactBlock) -> Optional[str]:
+        """Check one block as Blockchain.check_block does, comparing raw digests instead of hex strings."""
+        if previous_block is not None and previous_block.digest != block.previous_digest:
+            return f"Chain broken between blocks {block_index - 1} and {block_index}"
+        if block.digest != block.calc_digest():
+            return f"Invalid hash in block {block_index}"
+        if isinstance(block, MerkleBatch) and not block.verify_merkle_root():
+            return f"Merkle root mismatch in block {block_index}"
+        return None
+
+    def make_block(self, data: str) -> CompactBlock:
+        """Build, without appending, a compact block that follows the current tail."""
+        return CompactBlock(
+            timestamp=time.time_ns() // 1000,
+            data=data,
+            previous_digest=self.tail.digest
+        )
+
+    def make_batch(self, transactions: list[str]) -> CompactBatchBlock:
+        """Build, without appending, a compact batch block that follows the current tail."""
+        return CompactBatchBlock(
+            timestamp=time.time_ns() // 1000,
+            transactions=transactions,
+            previous_digest=self.tail.digest
+        )
+
+    def append_block(self, new_block: CompactBlock) -> None:
+        """
+        Link an already-built block onto the tail of the chain.
+
+        Parameters:
+        -----------
+        new_block : CompactBlock
+            The block to be appended. Its previous_digest must match the tail.
+        """
+        self.tail.next = new_block
+        self.tail = new_block
+        self.length += 1
+        self.blocks.append(new_block)
+        self.hash_index[new_block.digest] = new_block
+
+    def get_block_by_hash(self, block_hash: str) -> Optional[CompactBlock]:
+        """
+        Get block by its hex hash.
+
+        Parameters:
+        -----------
+        block_hash : str
+            The hex digest of the block to retrieve.
+
+        Returns:
+        --------
+        Optional[CompactBlock]
+            The block with the given hash or None if no such block exists.
+        """
+        try:
+            return self.hash_index.get(bytes.fromhex(block_hash))
+        except ValueError:
+            return None
+
+def benchmark_block_memory(count: int = 100000) -> dict[str, float]:
+    """
+    Measure the average memory allocated per block for Block and CompactBlock.
+
+    Only the linked blocks themselves are measured, not the chain indexes.
+
+    Parameters:
+    -----------
+    count : int
+        Number of linked blocks built for each representation.
+
+    Returns:
+    --------
+    dict[str, float]
+        Bytes per block keyed by class name.
+    """
+    results = {}
+    for name in ("Block", "CompactBlock"):
+        tracemalloc.start()
+        head = None
+        if name == "Block":
+            previous_hash = "0"
+            for i in range(count):
+                block = Block(datetime.datetime.now(), f"Transaction {i}", previous_hash)
+                block.next, head = head, block
+                previous_hash = block.hash
+        else:
+            previous_digest = bytes(32)
+            for i in range(count):
+                block = CompactBlock(time.time_ns() // 1000, f"Transaction {i}", previous_digest)
+                block.next, head = head, block
+                previous_digest = block.digest
+        allocated, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        results[name] = allocated / count
+        del head, block
+    return results
+
+class BlockStore:
+    """
+    An append-only on-disk store of blocks split into segment files.
+
+    Each block is written as a length-prefixed binary record. A separate index
+    file holds one fixed-width (segment, offset, length) entry per block, so
+    opening a store only reads the index and reads go through mmap.
+
+    Attributes:
+    -----------
+    path : str
+        The directory holding the segment and index files.
+    max_segment_bytes : int
+        Size after which appends roll over to a new segment file.
+    """
+    INDEX_ENTRY = struct.Struct("<IQI")  # segment number, offset, record length
+    LENGTH_PREFIX = struct.Struct("<I")
+    NONE_LENGTH = 0xFFFFFFFF  # Field length marking a None value
+
+    def __init__(self, path: str, max_segment_bytes: int = 64 * 1024 * 1024) -> None:
+        """
+        Open the store at path, creating the directory if needed.
+
+        Parameters:
+        -----------
+        path : str
+            The directory holding the segment and index files.
+        max_segment_bytes : int
+            Size after which appends roll over to a new segment file.
+        """
+        if max_segment_bytes <= 0:
+            raise ValueError("Segment size must be a positive integer")
+
+        os.makedirs(path, exist_ok=True)
+        self.path: str = path
+        self.max_segment_bytes: int = max_segment_bytes
+
+        index_path = os.path.join(path, "index.dat")
+        with open(index_path, "ab+") as index_file:
+            index_file.seek(0)
+            index = index_file.read()
+        # Drop a torn trailing entry left by an interrupted append
+        self.index: bytearray = bytearray(index[:len(index) - len(index) % self.INDEX_ENTRY.size])
+
+        # After a power loss the index may be on disk while the records it
+        # points at are not, so drop trailing entries past the segment data
+        self.segment: int = 0
+        self.segment_size: int = 0
+        while self.index:
+            segment, offset, length = self.INDEX_ENTRY.unpack_from(self.index, len(self.index) - self.INDEX_ENTRY.size)
+            end = offset + self.LENGTH_PREFIX.size + length
+            segment_path = self._segment_path(segment)
+            if os.path.exists(segment_path) and os.path.getsize(segment_path) >= end:
+                self.segment, self.segment_size = segment, end
+                break
+            del self.index[-self.INDEX_ENTRY.size:]
+
+        self.index_file = open(index_path, "r+b")
+        self.index_file.truncate(len(self.index))
+        self.index_file.seek(0, os.SEEK_END)
+
+        self.segment_file = open(self._segment_path(self.segment), "ab")
+        # Only ever shrink: cut an unindexed partial record, never pad with zeros
+        if self.segment_file.tell() > self.segment_size:
+            self.segment_file.truncate(self.segment_size)
+        self.maps: dict[int, mmap.mmap] = {}
+
+    def _segment_path(self, segment: int) -> str:
+        """Return the file name of a segment."""
+        return os.path.join(self.path, f"segment-{segment:05d}.dat")
+
+    @classmethod
+    def encode_block(cls, block: Block) -> bytes:
+        """
+        Serialize a block's fields as length-prefixed UTF-8 strings.
+
+        A batch block is followed by its transaction count and transactions,
+        so it is rebuilt in full and its Merkle root can be re-checked.
+        """
+        fields = [block.timestamp.isoformat(" "), block.data, block.previous_hash, block.hash]
+        parts = [cls._encode_field(field) for field in fields]
+        if isinstance(block, BatchBlock):
+            parts.append(cls.LENGTH_PREFIX.pack(len(block.transactions)))
+            parts.extend(cls._encode_field(transaction) for transaction in block.transactions)
+        return b"".join(parts)
+
+    @classmethod
+    def _encode_field(cls, field: object) -> bytes:
+        """Encode one field, or the None marker, with its length prefix."""
+        if field is None:
+            return cls.LENGTH_PREFIX.pack(cls.NONE_LENGTH)
+        encoded = str(field).encode("utf-8")
+        return cls.LENGTH_PREFIX.pack(len(encoded)) + encoded
+
+    @classmethod
+    def _decode_field(cls, buffer: bytes, position: int) -> tuple[Optional[str], int]:
+        """Decode the field at position, returning it and the position after it."""
+        (length,) = cls.LENGTH_PREFIX.unpack_from(buffer, position)
+        position += cls.LENGTH_PREFIX.size
+        if length == cls.NONE_LENGTH:
+            return None, position
+        return bytes(buffer[position:position + length]).decode("utf-8"), position + length
+
+    @classmethod
+    def decode_block(cls, buffer: bytes) -> Block:
+        """Rebuild a block from the bytes produced by encode_block."""
+        fields = []
+        position = 0
+        for _ in range(4):
+            field, position = cls._decode_field(buffer, position)
+            fields.append(field)
+        timestamp, data, previous_hash, block_hash = fields
+        timestamp = datetime.datetime.fromisoformat(timestamp)
+        if position == len(buffer):
+            return Block.from_fields(timestamp, data, previous_hash, block_hash)
+
+        (count,) = cls.LENGTH_PREFIX.unpack_from(buffer, position)
+        position += cls.LENGTH_PREFIX.size
+        transactions = []
+        for _ in range(count):
+            transaction, position = cls._decode_field(buffer, position)
+            transactions.append(transaction)
+        return BatchBlock.from_fields(timestamp, data, previous_hash, block_hash, transactions)
+
+    def append(self, block: Block) -> None:
+        """
+        Append a block record and its index entry.
+
+        Parameters:
+        -----------
+        block : Block
+            The block to be stored.
+        """
+        payload = self.encode_block(block)
+        if self.segment_size and self.segment_size + len(payload) > self.max_segment_bytes:
+            self.sync()
+            self.segment_file.close()
+            self.segment += 1
+            self.segment_size = 0
+            # Truncate: a crash after an earlier rollover may have left an unindexed segment behind
+            self.segment_file = open(self._segment_path(self.segment), "wb")
+
+        offset = self.segment_size
+        self.segment_file.write(self.LENGTH_PREFIX.pack(len(payload)) + payload)
+        self.segment_file.flush()
+        self.segment_size += self.LENGTH_PREFIX.size + len(payload)
+
+        # The index is written last so it never points at a partial record
+        entry = self.INDEX_ENTRY.pack(self.segment, offset, len(payload))
+        self.index_file.write(entry)
+        self.index_file.flush()
+        self.index += entry
+
+    def sync(self) -> None:
+        """Force appended records and index entries to stable storage."""
+        os.fsync(self.segment_file.fileno())
+        os.fsync(self.index_file.fileno())
+
+    def _map(self, segment: int, end: int) -> mmap.mmap:
+        """Return a read-only map of a segment covering at least end bytes."""
+        segment_map = self.maps.get(segment)
+        if segment_map is None or len(segment_map) < end:
+            if segment_map is not None:
+                segment_map.close()
+            with open(self._segment_path(segment), "rb") as segment_file:
+                segment_map = mmap.mmap(segment_file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.maps[segment] = segment_map
+        return segment_map
+
+    def read(self, index: int) -> Block:
+        """
+        Read the block at a position.
+
+        Parameters:
+        -----------
+        index : int
+            The position of the block in the store.
+
+        Returns:
+        --------
+        Block
+            The stored block.
+        """
+        segment, offset, length = self.INDEX_ENTRY.unpack_from(self.index, index * self.INDEX_ENTRY.size)
+        start = offset + self.LENGTH_PREFIX.size
+        segment_map = self._map(segment, start + length)
+        return self.decode_block(segment_map[start:start + length])
+
+    def __len__(self) -> int:
+        """Return the number of stored blocks."""
+        return len(self.index) // self.INDEX_ENTRY.size
+
+    def __iter__(self) -> Iterator[Block]:
+        """Stream stored blocks in order, one record at a time."""
+        for index in range(len(self)):
+            yield self.read(index)
+
+    def close(self) -> None:
+        """Release file handles and maps."""
+        for segment_map in self.maps.values():
+            segment_map.close()
+        self.maps.clear()
+        self.segment_file.close()
+        self.index_file.close()
+
+    def __enter__(self) -> 'BlockStore':
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+class PersistentBlockchain(Blockchain):
+    """
+    A blockchain whose blocks live in a BlockStore rather than in memory.
+
+    Only the tail block is kept resident; positional reads and iteration go
+    through the store. There are no in-memory ``blocks`` or ``hash_index``
+    attributes: the hash-to-position map is built by the first
+    get_block_by_hash call.
+    """
+    def __init__(self, path: str, max_segment_bytes: int = 64 * 1024 * 1024) -> None:
+        """
+        Open (or create) a persistent blockchain in the given directory.
+
+        Parameters:
+        -----------
+        path : str
+            The directory holding the segment and index files.
+        max_segment_bytes : int
+            Size after which appends roll over to a new segment file.
+        """
+        # Blockchain.__init__ is not called: its in-memory blocks and hash_index would stay empty
+        self.store: BlockStore = BlockStore(path, max_segment_bytes)
+        self.hash_positions: Optional[dict[str, int]] = None
+        self.tail: Optional[Block] = None
+        self.length: int = 0
+        self.verified_height: int = 0
+        self.create_genesis_block()
+
+    def create_genesis_block(self) -> None:
+        """Load the tail of an existing store, or write the genesis block to a new one."""
+        if len(self.store) == 0:
+            genesis_block = Block(
+                timestamp=datetime.datetime.now(),
+                data="Genesis Block",
+                previous_hash="0"
+            )
+            self.store.append(genesis_block)
+        self.tail = self.store.read(len(self.store) - 1)
+        self.length = len(self.store)
+        self.verified_height = 0
+
+    def append_block(self, new_block: Block) -> None:
+        """
+        Append an already-built block to the store.
+
+        Batch blocks are stored with their transactions and come back as
+        BatchBlock objects when read.
+
+        Parameters:
+        -----------
+        new_block : Block
+            The block to be appended. Its previous_hash must match the tail.
+        """
+        self.store.append(new_block)
+        if self.hash_positions is not None:
+            self.hash_positions[new_block.hash] = self.length
+        self.tail = new_block
+        self.length += 1
+
+    def get_block_at_index(self, index: int) -> Optional[Block]:
+        """
+        Get block at specific index, read from the store.
+
+        Parameters:
+        -----------
+        index : int
+            The index of the block to retrieve.
+
+        Returns:
+        --------
+        Optional[Block]
+            The block at the specified index or None if index is invalid.
+        """
+        if index < 0 or index >= self.length:
+            return None
+        return self.store.read(index)
+
+    def get_block_by_hash(self, block_hash: str) -> Optional[Block]:
+        """
+        Get block by its hash, building the hash index on first call.
+
+        The first call reads every stored record once, O(n) in the length of
+        the chain; later lookups and appends keep the map current in O(1).
+        Decoding does no hashing, but on very long chains the first lookup is
+        still a full scan, so warm it up at startup when latency matters.
+
+        Parameters:
+        -----------
+        block_hash : str
+            The hex digest of the block to retrieve.
+
+        Returns:
+        --------
+        Optional[Block]
+            The block with the given hash or None if no such block exists.
+        """
+        if self.hash_positions is None:
+            self.hash_positions = {block.hash: index for index, block in enumerate(self.store)}
+        index = self.hash_positions.get(block_hash)
+        return None if index is None else self.store.read(index)
+
+    def __iter__(self) -> Iterator[Block]:
+        """Stream the blocks from the store without linking them in memory."""
+        return iter(self.store)
+
+    def close(self) -> None:
+        """Close the underlying store."""
+        self.store.close()
+
+
+class NotDurableError(Exception):
+    """
+    Set on an ingestion future when its block was appended to the chain but
+    the following store sync failed, so the block may not survive a crash.
+
+    Attributes:
+    -----------
+    block : Block
+        The block that is already linked into the chain.
+    """
+    def __init__(self, block: Block, cause: BaseException) -> None:
+        super().__init__(f"Block appended but not synced: {cause}")
+        self.block: Block = block
+        self.__cause__ = cause
+
+class BlockIngestor:
+    """
+    A queue-fed pipeline that appends blocks to a chain on a worker thread.
+
+    Producers hand over data with submit, which blocks once the bounded queue
+    is full (backpressure). The worker drains the queue in batches, assigns
+    timestamps and previous hashes in arrival order, hashes and appends each
+    block, then syncs a persistent store once per batch (group fsync).
+    """
+    _STOP = object()  # Sentinel telling the worker to exit
+
+    def __init__(self, chain: Blockchain, max_pending: int = 1024, batch_size: int = 256) -> None:
+        """
+        Start the worker thread for a chain.
+
+        Parameters:
+        -----------
+        chain : Blockchain
+            The chain receiving the blocks; only the worker may append to it.
+        max_pending : int
+            Capacity of the queue before submit blocks.
+        batch_size : int
+            Maximum number of blocks appended between two syncs.
+        """
+        if max_pending <= 0:
+            raise ValueError("Queue capacity must be a positive integer")
+        if batch_size <= 0:
+            raise ValueError("Batch size must be a positive integer")
+
+        self.chain: Blockchain = chain
+        self.batch_size: int = batch_size
+        self.pending: queue.Queue = queue.Queue(maxsize=max_pending)
+        self.closed: bool = False
+        self.lock = threading.Lock()  # Makes the closed check and enqueue atomic with close()
+        self.worker = threading.Thread(target=self._run, daemon=True)
+        self.worker.start()
+
+    def submit(self, data: str, timeout: Optional[float] = None) -> Future:
+        """
+        Queue data for a new block, waiting while the queue is full.
+
+        Parameters:
+        -----------
+        data : str
+            The data to be stored in the new block.
+        timeout : Optional[float]
+            Seconds to wait for queue space, forever if None.
+
+        Returns:
+        --------
+        Future
+            Resolves to the appended Block once it is durable. If the block is
+            appended but the sync fails, it raises NotDurableError instead.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        if not self.lock.acquire(timeout=-1 if timeout is None else timeout):
+            raise queue.Full
+        try:
+            # Holding the lock keeps close() from queueing the stop sentinel in between
+            if self.closed:
+                raise ValueError("Ingestor is closed")
+            future: Future = Future()
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            self.pending.put((data, future), timeout=remaining)
+        finally:
+            self.lock.release()
+        return future
+
+    def _run(self) -> None:
+        """Drain the queue in batches until the stop sentinel arrives."""
+        store = getattr(self.chain, "store", None)
+        running = True
+        while running:
+            batch = [self.pending.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.pending.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                appended = []
+                for item in batch:
+                    if item is self._STOP:
+                        running = False
+                        continue
+                    data, future = item
+                    # Skip blocks whose caller cancelled them; afterwards the future can no longer be cancelled
+                    if not future.set_running_or_notify_cancel():
+                        continue
+                    try:
+                        new_block = self.chain.make_block(data)
+                        self.chain.append_block(new_block)
+                        appended.append((future, new_block))
+                    except Exception as error:
+                        future.set_exception(error)
+
+                try:
+                    if store is not None and appended:
+                        store.sync()
+                except Exception as error:
+                    for future, new_block in appended:
+                        future.set_exception(NotDurableError(new_block, error))
+                else:
+                    for future, new_block in appended:
+                        future.set_result(new_block)
+            finally:
+                # Always account for the batch so flush() cannot hang on a failure
+                for _ in batch:
+                    self.pending.task_done()
+
+    def flush(self) -> None:
+        """Wait until every submitted block has been appended."""
+        self.pending.join()
+
+    def close(self) -> None:
+        """Append everything still queued, then stop the worker."""
+        with self.lock:
+            if self.closed:
+                return
+            self.closed = True
+            self.pending.put(self._STOP)
+        self.worker.join()
+
+    def __enter__(self) -> 'BlockIngestor':
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
 if __name__ == "__main__":
     # Test cases
     print("Test Case 1: Basic blockchain functionality")
@@ -174,6 +1236,11 @@ if __name__ == "__main__":
     print("Block at index 2:", blockchain.get_block_at_index(2))  # Should return Block 2
     print("Block at index 4:", blockchain.get_block_at_index(4))  # Should return None
 
+    # Test getting blocks by hash
+    block_2 = blockchain.get_block_at_index(2)
+    print("Lookup by hash matches:", blockchain.get_block_by_hash(block_2.hash) is block_2)  # Should return True
+    print("Unknown hash:", blockchain.get_block_by_hash("0" * 64))  # Should return None
+
     print("\nTest Case 4: Empty block creation")
     blockchain = Blockchain()
     # Try to add blocks with empty data
@@ -205,3 +1272,162 @@ if __name__ == "__main__":
     print(f"\nNumber of unique hashes: {len(unique_hashes)}")
     print(f"Number of blocks: {len(test_blocks)}")
     print(f"All hashes are unique: {len(unique_hashes) == len(test_blocks)}")
+
+    print("\nTest Case 6: Incremental and parallel validation")
+    blockchain = Blockchain()
+    for i in range(200):
+        blockchain.add_block(f"Transaction {i}")
+    print(blockchain.validate_chain())  # Should return (True, None)
+    blockchain.add_block("Transaction 200")
+    print(blockchain.validate_new_blocks())  # Should return (True, None), checking one block
+    print(blockchain.audit_chain(workers=2, chunk_size=64))  # Should return (True, None)
+
+    # Tampering below the checkpoint is only caught by the full audit
+    blockchain.get_block_at_index(100).data = "Tampered"
+    print(blockchain.validate_new_blocks())  # Should return (True, None)
+    print(blockchain.audit_chain(workers=2, chunk_size=64))  # Should return (False, 'Invalid hash in block 100')
+
+    # With several problems, the audit reports the same first one as validate_chain
+    blockchain.get_block_at_index(4).previous_hash = "broken"
+    print(blockchain.validate_chain() == blockchain.audit_chain(workers=2, chunk_size=4))  # Should return True
+    blockchain.get_block_at_index(1).data = "Tampered"
+    print(blockchain.validate_chain() == blockchain.audit_chain(workers=2, chunk_size=4))  # Should return True
+
+    print("\nTest Case 7: Persistent blockchain")
+    import tempfile
+    with tempfile.TemporaryDirectory() as directory:
+        # A tiny segment size forces several segment files
+        persistent = PersistentBlockchain(directory, max_segment_bytes=1024)
+        for i in range(50):
+            persistent.add_block(f"Stored {i}")
+        persistent.add_block(None)
+        tail_hash = persistent.tail.hash
+        persistent.close()
+
+        reopened = PersistentBlockchain(directory, max_segment_bytes=1024)
+        print("Length after reopen:", reopened.length)  # Should return 52
+        print("Tail survives reopen:", reopened.tail.hash == tail_hash)  # Should return True
+        print("Block 10 data:", reopened.get_block_at_index(10).data)  # Should return Stored 9
+        print("None data survives:", reopened.get_block_by_hash(tail_hash).data)  # Should return None
+        print("No in-memory indexes:", not hasattr(reopened, "hash_index") and not hasattr(reopened, "blocks"))  # Should return True
+        print(reopened.validate_chain())  # Should return (True, None)
+        reopened.close()
+
+        # Index entries whose records never reached the disk are dropped on open
+        reopened = PersistentBlockchain(directory, max_segment_bytes=1024)
+        last_segment = reopened.store._segment_path(reopened.store.segment)
+        reopened.close()
+        with open(last_segment, "r+b") as segment_file:
+            segment_file.truncate(os.path.getsize(last_segment) - 10)
+        reopened = PersistentBlockchain(directory, max_segment_bytes=1024)
+        print("Length after losing a record:", reopened.length)  # Should return 51
+        reopened.add_block("After power loss")
+        print(reopened.validate_chain())  # Should return (True, None)
+        reopened.close()
+
+        # An orphan segment left by a crash right after rollover is overwritten, not appended to
+        with open(os.path.join(directory, f"segment-{reopened.store.segment + 1:05d}.dat"), "wb") as orphan:
+            orphan.write(b"junk left by a crash")
+        reopened = PersistentBlockchain(directory, max_segment_bytes=1024)
+        for i in range(20):
+            reopened.add_block(f"After crash {i}")
+        print(reopened.validate_chain())  # Should return (True, None)
+        reopened.close()
+
+    print("\nTest Case 8: Merkle-batched transactions")
+    blockchain = Blockchain()
+    transactions = [f"Payment {i}" for i in range(11)]
+    batch_block = blockchain.add_batch(transactions)
+    print(blockchain.validate_chain())  # Should return (True, None)
+    proof = batch_block.proof(6)
+    print("Proof length:", len(proof))  # Should return 4
+    print(verify_merkle_proof("Payment 6", proof, batch_block.merkle_root))  # Should return True
+    print(verify_merkle_proof("Payment 7", proof, batch_block.merkle_root))  # Should return False
+    print(all(verify_merkle_proof(t, batch_block.proof(i), batch_block.merkle_root)
+              for i, t in enumerate(transactions)))  # Should return True
+
+    # Editing a transaction no longer matches the Merkle root in the header
+    batch_block.transactions[1] = "evil"
+    print(blockchain.validate_chain())  # Should return (False, 'Merkle root mismatch in block 1')
+    print(blockchain.audit_chain(workers=1))  # Should return (False, 'Merkle root mismatch in block 1')
+    batch_block.transactions[1] = "Payment 1"
+
+    # Persistent chains keep the transactions of batch blocks
+    with tempfile.TemporaryDirectory() as directory:
+        persistent = PersistentBlockchain(directory)
+        persistent.add_batch(transactions)
+        persistent.close()
+        reopened = PersistentBlockchain(directory)
+        stored_batch = reopened.get_block_at_index(1)
+        print(stored_batch.transactions == transactions)  # Should return True
+        print(verify_merkle_proof("Payment 6", stored_batch.proof(6), stored_batch.merkle_root))  # Should return True
+        print(reopened.validate_chain())  # Should return (True, None)
+        reopened.close()
+
+    print("\nTest Case 9: Queue-fed ingestion from many producers")
+    with tempfile.TemporaryDirectory() as directory:
+        persistent = PersistentBlockchain(directory)
+        with BlockIngestor(persistent, max_pending=8, batch_size=4) as ingestor:
+            producers = [
+                threading.Thread(target=lambda p=p: [ingestor.submit(f"Producer {p} item {i}") for i in range(25)])
+                for p in range(4)
+            ]
+            for producer in producers:
+                producer.start()
+            for producer in producers:
+                producer.join()
+            last = ingestor.submit("Last item")
+        print("Last block appended:", last.result().data)  # Should return Last item
+        print("Length:", persistent.length)  # Should return 102
+        print(persistent.validate_chain())  # Should return (True, None)
+
+        # A failed sync reports the block as appended but not durable
+        def failing_sync() -> None:
+            raise OSError("disk full")
+        persistent.store.sync = failing_sync
+        with BlockIngestor(persistent) as ingestor:
+            unsynced = ingestor.submit("Unsynced item")
+        error = unsynced.exception()
+        print(type(error).__name__, error.block is persistent.tail)  # Should return NotDurableError True
+        persistent.close()
+
+    # A cancelled future is skipped and the worker keeps serving later submissions
+    chain = Blockchain()
+    release = threading.Event()
+    build_block = chain.make_block
+    def held_make_block(data: str) -> Block:
+        release.wait()  # Keep the worker busy so the next item is still queued
+        return build_block(data)
+    chain.make_block = held_make_block
+    with BlockIngestor(chain, batch_size=1) as ingestor:
+        ingestor.submit("Blocker")
+        cancelled = ingestor.submit("Cancelled item")
+        print(cancelled.cancel())  # Should return True
+        release.set()
+        after_cancel = ingestor.submit("After cancel")
+        print(after_cancel.result(timeout=5).data)  # Should return After cancel
+        ingestor.flush()
+    print([block.data for block in chain][1:])  # Should return ['Blocker', 'After cancel']
+
+    print("\nTest Case 10: Compact blocks")
+    compact_chain = CompactBlockchain()
+    compact_chain.add_block("Compact 1")
+    compact_chain.add_block("Compact 2")
+    compact_block = compact_chain.get_block_at_index(2)
+    print(compact_chain.get_block_by_hash(compact_block.hash) is compact_block)  # Should return True
+    print(compact_chain.validate_chain())  # Should return (True, None)
+    compact_chain.get_block_at_index(1).data = "Tampered"
+    print(compact_chain.validate_new_blocks(), compact_chain.audit_chain(workers=1))  # Should return (True, None) (False, 'Invalid hash in block 1')
+    compact_chain.get_block_at_index(1).data = "Compact 1"
+    print(compact_chain.audit_chain(workers=2, chunk_size=1))  # Should return (True, None)
+    compact_batch = compact_chain.add_batch(transactions)
+    print(verify_merkle_proof("Payment 3", compact_batch.proof(3), compact_batch.merkle_root))  # Should return True
+    compact_batch.transactions[0] = "evil"
+    print(compact_chain.validate_chain())  # Should return (False, 'Merkle root mismatch in block 3')
+    compact_batch.transactions[0] = "Payment 0"
+    with BlockIngestor(compact_chain) as ingestor:
+        ingested = ingestor.submit("Ingested compact")
+    print(type(ingested.result()).__name__, compact_chain.validate_chain())  # Should return CompactBlock (True, None)
+    memory = benchmark_block_memory(20000)
+    print(f"Bytes per block: Block {memory['Block']:.0f}, CompactBlock {memory['CompactBlock']:.0f}")
+    print("Compact is smaller:", memory["CompactBlock"] < memory["Block"])  # Should return True
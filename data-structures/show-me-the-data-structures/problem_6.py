@@ -1,4 +1,13 @@
-from typing import Optional
+import time
+import tracemalloc
+from array import array
+from bisect import bisect_left
+from typing import Iterable, Iterator, Optional
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; IntSequence falls back to pure Python kernels
+    np = None
 
 class Node:
     """
@@ -44,6 +53,10 @@ class LinkedList:
     -----------
     head : Optional[Node]
         The head node of the linked list.
+    tail : Optional[Node]
+        The last node of the linked list, for O(1) appends.
+    length : int
+        The cached number of nodes in the linked list.
     """
 
     def __init__(self) -> None:
@@ -51,6 +64,27 @@ class LinkedList:
         Constructs all the necessary attributes for the LinkedList object.
         """
         self.head: Optional[Node] = None
+        self.tail: Optional[Node] = None
+        self.length: int = 0
+
+    @classmethod
+    def from_iterable(cls, values: Iterable[int]) -> 'LinkedList':
+        """
+        Build a linked list from an iterable in a single linear pass.
+
+        Parameters:
+        -----------
+        values : Iterable[int]
+            The values to be stored, in order.
+
+        Returns:
+        --------
+        LinkedList
+            A new linked list holding the values.
+        """
+        linked_list = cls()
+        linked_list.extend(values)
+        return linked_list
 
     def __str__(self) -> str:
         """
@@ -68,6 +102,20 @@ class LinkedList:
             cur_head = cur_head.next
         return out_string
 
+    def __iter__(self) -> Iterator[int]:
+        """
+        Iterate over the values of the linked list from head to tail.
+
+        Returns:
+        --------
+        Iterator[int]
+            An iterator over the node values.
+        """
+        node: Optional[Node] = self.head
+        while node:
+            yield node.value
+            node = node.next
+
     def append(self, value: int) -> None:
         """
         Append a new node with the given value to the end of the linked list.
@@ -77,15 +125,25 @@ class LinkedList:
         value : int
             The value to be stored in the new node.
         """
-        if self.head is None:
-            self.head = Node(value)
-            return
-
-        node: Node = self.head
-        while node.next:
-            node = node.next
+        node: Node = Node(value)
+        if self.tail is None:
+            self.head = node
+        else:
+            self.tail.next = node
+        self.tail = node
+        self.length += 1
+
+    def extend(self, values: Iterable[int]) -> None:
+        """
+        Append every value of an iterable to the end of the linked list.
 
-        node.next = Node(value)
+        Parameters:
+        -----------
+        values : Iterable[int]
+            The values to be appended, in order.
+        """
+        for value in values:
+            self.append(value)
 
     def size(self) -> int:
         """
@@ -96,16 +154,152 @@ class LinkedList:
         int
             The number of nodes in the linked list.
         """
-        size: int = 0
-        node: Optional[Node] = self.head
-        while node:
-            size += 1
-            node = node.next
+        return self.length
+
+
+def iter_union(llist_1: LinkedList, llist_2: LinkedList) -> Iterator[int]:
+    """
+    Lazily yield the union of two linked lists.
 
-        return size
+    Values are produced in order of first appearance (llist_1, then llist_2)
+    as soon as they are read, so a caller that stops early never touches the
+    rest of the inputs.
 
+    Parameters:
+    -----------
+    llist_1 : LinkedList
+        The first linked list.
+    llist_2 : LinkedList
+        The second linked list.
 
-def union(llist_1: LinkedList, llist_2: LinkedList) -> LinkedList:
+    Returns:
+    --------
+    Iterator[int]
+        An iterator over the unique elements of both linked lists.
+    """
+    seen = set()
+    for llist in (llist_1, llist_2):
+        for value in llist:
+            if value not in seen:
+                seen.add(value)
+                yield value
+
+def iter_intersection(llist_1: LinkedList, llist_2: LinkedList) -> Iterator[int]:
+    """
+    Lazily yield the intersection of two linked lists.
+
+    Only the smaller list is loaded into a set; the larger one is streamed and
+    each common value is yielded as soon as it is found.
+
+    Parameters:
+    -----------
+    llist_1 : LinkedList
+        The first linked list.
+    llist_2 : LinkedList
+        The second linked list.
+
+    Returns:
+    --------
+    Iterator[int]
+        An iterator over the unique elements present in both linked lists.
+    """
+    if llist_1.size() > llist_2.size():
+        llist_1, llist_2 = llist_2, llist_1
+
+    candidates = set(llist_1)
+    for value in llist_2:
+        if value in candidates:
+            # Remove as we go so each common value is yielded once
+            candidates.discard(value)
+            yield value
+            if not candidates:
+                return
+
+_END = object()  # Marks an exhausted iterator in the sorted merges
+
+def iter_sorted_union(llist_1: LinkedList, llist_2: LinkedList) -> Iterator[int]:
+    """
+    Lazily yield the union of two ascending linked lists with a two-pointer merge.
+
+    Duplicates inside and across the inputs are dropped, so values come out
+    ascending and unique. Uses O(1) extra memory.
+
+    Parameters:
+    -----------
+    llist_1 : LinkedList
+        The first linked list, in ascending order.
+    llist_2 : LinkedList
+        The second linked list, in ascending order.
+
+    Returns:
+    --------
+    Iterator[int]
+        An ascending iterator over all unique elements.
+    """
+    # Walk through iterators rather than nodes so IntSequence works too
+    iterator_1, iterator_2 = iter(llist_1), iter(llist_2)
+    value_1 = next(iterator_1, _END)
+    value_2 = next(iterator_2, _END)
+    last: Optional[int] = None
+    emitted = False
+
+    while value_1 is not _END or value_2 is not _END:
+        # Take the smaller head; on a tie both lists advance
+        if value_2 is _END or (value_1 is not _END and value_1 < value_2):
+            value = value_1
+            value_1 = next(iterator_1, _END)
+        elif value_1 is _END or value_2 < value_1:
+            value = value_2
+            value_2 = next(iterator_2, _END)
+        else:
+            value = value_1
+            value_1 = next(iterator_1, _END)
+            value_2 = next(iterator_2, _END)
+
+        if not emitted or value != last:
+            emitted = True
+            last = value
+            yield value
+
+def iter_sorted_intersection(llist_1: LinkedList, llist_2: LinkedList) -> Iterator[int]:
+    """
+    Lazily yield the intersection of two ascending linked lists with a two-pointer merge.
+
+    Values come out ascending and unique. Uses O(1) extra memory and stops
+    as soon as either list ends.
+
+    Parameters:
+    -----------
+    llist_1 : LinkedList
+        The first linked list, in ascending order.
+    llist_2 : LinkedList
+        The second linked list, in ascending order.
+
+    Returns:
+    --------
+    Iterator[int]
+        An ascending iterator over the elements present in both lists.
+    """
+    iterator_1, iterator_2 = iter(llist_1), iter(llist_2)
+    value_1 = next(iterator_1, _END)
+    value_2 = next(iterator_2, _END)
+    last: Optional[int] = None
+    emitted = False
+
+    while value_1 is not _END and value_2 is not _END:
+        if value_1 < value_2:
+            value_1 = next(iterator_1, _END)
+        elif value_2 < value_1:
+            value_2 = next(iterator_2, _END)
+        else:
+            if not emitted or value_1 != last:
+                emitted = True
+                last = value_1
+                yield last
+            value_1 = next(iterator_1, _END)
+            value_2 = next(iterator_2, _END)
+
+def union(llist_1: LinkedList, llist_2: LinkedList, is_sorted: bool = False) -> LinkedList:
     """
     Compute the union of two linked lists.
 
@@ -115,34 +309,170 @@ def union(llist_1: LinkedList, llist_2: LinkedList) -> LinkedList:
         The first linked list.
     llist_2 : LinkedList
         The second linked list.
+    is_sorted : bool
+        If True, both lists are in ascending order and are merged without sets.
 
     Returns:
     --------
     LinkedList
         A new linked list containing all unique elements from both input linked lists.
     """
-    # Use a set to store all unique elements
-    unique_elements = set()
-    current = llist_1.head
-    while current:
-        unique_elements.add(current.value)
-        current = current.next
+    if is_sorted:
+        return sorted_union(llist_1, llist_2)
+    return LinkedList.from_iterable(iter_union(llist_1, llist_2))
 
-    current = llist_2.head
-    while current:
-        unique_elements.add(current.value)
-        current = current.next
+def intersection(llist_1: LinkedList, llist_2: LinkedList, is_sorted: bool = False) -> LinkedList:
+    """
+    Compute the intersection of two linked lists.
 
-    # Create a new linked list to store the union
-    union_list = LinkedList()
-    for value in unique_elements:
-        union_list.append(value)
+    Parameters:
+    -----------
+    llist_1 : LinkedList
+        The first linked list.
+    llist_2 : LinkedList
+        The second linked list.
+    is_sorted : bool
+        If True, both lists are in ascending order and are merged without sets.
+
+    Returns:
+    --------
+    LinkedList
+        A new linked list containing all elements that are present in both input linked lists.
+    """
+    if is_sorted:
+        return sorted_intersection(llist_1, llist_2)
+    return LinkedList.from_iterable(iter_intersection(llist_1, llist_2))
 
+def sorted_union(llist_1: LinkedList, llist_2: LinkedList) -> LinkedList:
+    """
+    Compute the union of two ascending linked lists with a two-pointer merge.
+
+    Runs in O(n + m) time with O(1) extra memory beyond the result.
+
+    Parameters:
+    -----------
+    llist_1 : LinkedList
+        The first linked list, in ascending order.
+    llist_2 : LinkedList
+        The second linked list, in ascending order.
+
+    Returns:
+    --------
+    LinkedList
+        A new ascending linked list of all unique elements.
+    """
+    return LinkedList.from_iterable(iter_sorted_union(llist_1, llist_2))
+
+def sorted_intersection(llist_1: LinkedList, llist_2: LinkedList) -> LinkedList:
+    """
+    Compute the intersection of two ascending linked lists with a two-pointer merge.
+
+    Runs in O(n + m) time with O(1) extra memory beyond the result.
+
+    Parameters:
+    -----------
+    llist_1 : LinkedList
+        The first linked list, in ascending order.
+    llist_2 : LinkedList
+        The second linked list, in ascending order.
+
+    Returns:
+    --------
+    LinkedList
+        A new ascending linked list of the elements present in both lists.
+    """
+    return LinkedList.from_iterable(iter_sorted_intersection(llist_1, llist_2))
+
+def union_all(llists: Iterable[LinkedList]) -> LinkedList:
+    """
+    Compute the union of any number of linked lists.
+
+    Values are streamed straight from each input into the result, in order of
+    first appearance, so no intermediate pairwise unions are built.
+
+    Parameters:
+    -----------
+    llists : Iterable[LinkedList]
+        The linked lists to combine.
+
+    Returns:
+    --------
+    LinkedList
+        A new linked list containing every unique element of the inputs.
+    """
+    seen = set()
+    union_list = LinkedList()
+    for llist in llists:
+        for value in llist:
+            if value not in seen:
+                seen.add(value)
+                union_list.append(value)
     return union_list
 
-def intersection(llist_1: LinkedList, llist_2: LinkedList) -> LinkedList:
+def intersect_all(llists: Iterable[LinkedList]) -> LinkedList:
     """
-    Compute the intersection of two linked lists.
+    Compute the intersection of any number of linked lists.
+
+    The lists are processed smallest first, so the candidate set starts as
+    small as possible and only shrinks; processing stops as soon as it is empty.
+
+    Parameters:
+    -----------
+    llists : Iterable[LinkedList]
+        The linked lists to intersect.
+
+    Returns:
+    --------
+    LinkedList
+        A new linked list of the elements present in every input, in the
+        order they appear in the smallest input.
+    """
+    ordered = sorted(llists, key=lambda llist: llist.size())
+    if not ordered:
+        return LinkedList()
+
+    candidates = set(ordered[0])
+    for llist in ordered[1:]:
+        if not candidates:
+            break
+        candidates = {value for value in llist if value in candidates}
+
+    intersection_list = LinkedList()
+    for value in ordered[0]:
+        if value in candidates:
+            # Remove as we go so duplicates in the smallest list are emitted once
+            candidates.discard(value)
+            intersection_list.append(value)
+    return intersection_list
+
+def difference(llist_1: LinkedList, llist_2: LinkedList) -> LinkedList:
+    """
+    Compute the elements of the first linked list that are not in the second.
+
+    Parameters:
+    -----------
+    llist_1 : LinkedList
+        The linked list to take elements from.
+    llist_2 : LinkedList
+        The linked list of elements to exclude.
+
+    Returns:
+    --------
+    LinkedList
+        A new linked list of the unique elements of llist_1 absent from llist_2,
+        in their order in llist_1.
+    """
+    excluded = set(llist_2)
+    difference_list = LinkedList()
+    for value in llist_1:
+        if value not in excluded:
+            excluded.add(value)
+            difference_list.append(value)
+    return difference_list
+
+def symmetric_difference(llist_1: LinkedList, llist_2: LinkedList) -> LinkedList:
+    """
+    Compute the elements that are in exactly one of two linked lists.
 
     Parameters:
     -----------
@@ -154,30 +484,256 @@ def intersection(llist_1: LinkedList, llist_2: LinkedList) -> LinkedList:
     Returns:
     --------
     LinkedList
-        A new linked list containing all elements that are present in both input linked lists.
+        A new linked list of the unique elements found in only one input,
+        those from llist_1 first.
     """
-    # Use sets to find the intersection
-    elements_1 = set()
-    current = llist_1.head
-    while current:
-        elements_1.add(current.value)
-        current = current.next
+    elements_1 = set(llist_1)
+    elements_2 = set(llist_2)
+    symmetric_list = LinkedList()
+    for value in llist_1:
+        # Adding emitted values to the other set drops later duplicates
+        if value not in elements_2:
+            elements_2.add(value)
+            symmetric_list.append(value)
+    for value in llist_2:
+        if value not in elements_1:
+            elements_1.add(value)
+            symmetric_list.append(value)
+    return symmetric_list
+
+class IntSequence:
+    """
+    A compact, array-backed alternative to LinkedList for int-only workloads.
 
-    elements_2 = set()
-    current = llist_2.head
-    while current:
-        elements_2.add(current.value)
-        current = current.next
+    Values are stored unboxed as signed 64-bit integers in an ``array('q')``
+    (8 bytes each) instead of one Node object per element.
 
-    # Find the intersection of both sets
-    intersection_elements = elements_1.intersection(elements_2)
+    Attributes:
+    -----------
+    values : array
+        The stored values, in insertion order.
+    """
+    GALLOP_RATIO = 32  # Size ratio above which intersection gallops over the larger input
 
-    # Create a new linked list to store the intersection
-    intersection_list = LinkedList()
-    for value in intersection_elements:
-        intersection_list.append(value)
+    def __init__(self) -> None:
+        """
+        Constructs an empty IntSequence.
+        """
+        self.values: array = array('q')
 
-    return intersection_list
+    @classmethod
+    def from_iterable(cls, values: Iterable[int]) -> 'IntSequence':
+        """
+        Build a sequence from an iterable of ints.
+
+        Parameters:
+        -----------
+        values : Iterable[int]
+            The values to be stored, in order.
+
+        Returns:
+        --------
+        IntSequence
+            A new sequence holding the values.
+        """
+        sequence = cls()
+        sequence.extend(values)
+        return sequence
+
+    def __str__(self) -> str:
+        """
+        Return a string representation matching LinkedList's format.
+
+        Returns:
+        --------
+        str
+            The values separated by " -> ".
+        """
+        return "".join(str(value) + " -> " for value in self.values)
+
+    def __iter__(self) -> Iterator[int]:
+        """
+        Iterate over the stored values.
+
+        Returns:
+        --------
+        Iterator[int]
+            An iterator over the values.
+        """
+        return iter(self.values)
+
+    def __getitem__(self, index: int) -> int:
+        """
+        Return the value at a position.
+        """
+        return self.values[index]
+
+    def append(self, value: int) -> None:
+        """
+        Append a value to the end of the sequence.
+
+        Parameters:
+        -----------
+        value : int
+            The value to be appended.
+        """
+        self.values.append(value)
+
+    def extend(self, values: Iterable[int]) -> None:
+        """
+        Append every value of an iterable to the end of the sequence.
+
+        Parameters:
+        -----------
+        values : Iterable[int]
+            The values to be appended, in order.
+        """
+        self.values.extend(values)
+
+    def size(self) -> int:
+        """
+        Return the number of stored values.
+
+        Returns:
+        --------
+        int
+            The number of values in the sequence.
+        """
+        return len(self.values)
+
+def _gallop(values: array, target: int, low: int) -> int:
+    """
+    Return the first index at or after low whose value is >= target.
+
+    Probes 1, 2, 4, ... positions ahead of low, then binary searches the last
+    gap, so the cost is O(log d) for a jump of d positions.
+    """
+    step = 1
+    high = low
+    while high < len(values) and values[high] < target:
+        low = high + 1
+        high += step
+        step *= 2
+    return bisect_left(values, target, low, min(high, len(values)))
+
+def array_union(sequence_1: IntSequence, sequence_2: IntSequence) -> IntSequence:
+    """
+    Compute the union of two IntSequences.
+
+    Uses ``np.union1d`` when NumPy is installed, otherwise a set union sorted
+    in C.
+
+    Parameters:
+    -----------
+    sequence_1 : IntSequence
+        The first sequence.
+    sequence_2 : IntSequence
+        The second sequence.
+
+    Returns:
+    --------
+    IntSequence
+        A new ascending sequence of all unique elements.
+    """
+    result = IntSequence()
+    if np is not None:
+        merged = np.union1d(np.frombuffer(sequence_1.values, dtype=np.int64),
+                            np.frombuffer(sequence_2.values, dtype=np.int64))
+        result.values.frombytes(merged.astype(np.int64).tobytes())
+    else:
+        result.values = array('q', sorted(set(sequence_1.values).union(sequence_2.values)))
+    return result
+
+def array_intersection(sequence_1: IntSequence, sequence_2: IntSequence, is_sorted: bool = False) -> IntSequence:
+    """
+    Compute the intersection of two IntSequences.
+
+    Uses ``np.intersect1d`` when NumPy is installed, otherwise a set
+    intersection sorted in C. When both inputs are already ascending and one
+    is GALLOP_RATIO times larger than the other, each value of the smaller
+    input is instead located in the larger one without sorting it, by
+    galloping search (O(n log(m / n)) comparisons) or ``np.searchsorted``.
+
+    Parameters:
+    -----------
+    sequence_1 : IntSequence
+        The first sequence.
+    sequence_2 : IntSequence
+        The second sequence.
+    is_sorted : bool
+        If True, both sequences are in ascending order.
+
+    Returns:
+    --------
+    IntSequence
+        A new ascending sequence of the elements present in both inputs.
+    """
+    small, large = sequence_1.values, sequence_2.values
+    if len(small) > len(large):
+        small, large = large, small
+    skewed = is_sorted and len(large) >= IntSequence.GALLOP_RATIO * len(small)
+
+    result = IntSequence()
+    if np is not None:
+        small_array = np.frombuffer(small, dtype=np.int64)
+        large_array = np.frombuffer(large, dtype=np.int64)
+        if skewed:
+            positions = np.searchsorted(large_array, small_array)
+            found = positions < len(large_array)
+            found[found] = large_array[positions[found]] == small_array[found]
+            common = np.unique(small_array[found])
+        else:
+            common = np.intersect1d(small_array, large_array)
+        result.values.frombytes(common.astype(np.int64).tobytes())
+        return result
+
+    if not skewed:
+        result.values = array('q', sorted(set(small).intersection(large)))
+        return result
+
+    position = 0
+    for value in small:
+        position = _gallop(large, value, position)
+        if position == len(large):
+            break
+        if large[position] == value and (not result.values or result.values[-1] != value):
+            result.values.append(value)
+    return result
+
+def benchmark_sequences(count: int = 10 ** 6) -> dict[str, dict[str, float]]:
+    """
+    Compare memory and union/intersection time of LinkedList and IntSequence.
+
+    Parameters:
+    -----------
+    count : int
+        Number of elements in each input.
+
+    Returns:
+    --------
+    dict[str, dict[str, float]]
+        For each type, the bytes allocated per element and the seconds spent
+        on one union plus one intersection of two half-overlapping inputs.
+    """
+    results = {}
+    for name, sequence_type, union_function, intersection_function in (
+        ("LinkedList", LinkedList, union, intersection),
+        ("IntSequence", IntSequence, array_union, array_intersection),
+    ):
+        tracemalloc.start()
+        first = sequence_type.from_iterable(range(count))
+        allocated, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        second = sequence_type.from_iterable(range(count // 2, count + count // 2))
+
+        started = time.perf_counter()
+        union_function(first, second)
+        intersection_function(first, second)
+        elapsed = time.perf_counter() - started
+
+        results[name] = {"bytes_per_element": allocated / count, "seconds": elapsed}
+        del first, second
+    return results
 
 if __name__ == "__main__":
     ## Test case 1
@@ -264,3 +820,60 @@ if __name__ == "__main__":
     print("\nTest Case 5 (Lists with Negative Numbers):")
     print("Union:", union(linked_list_9, linked_list_10))  # Expected: -2, -1, 0, 1, 2, 4, 6
     print("Intersection:", intersection(linked_list_9, linked_list_10))  # Expected: -2, 0, 2
+
+    ## Test case 6 - Large lists build in linear time
+    linked_list_11 = LinkedList.from_iterable(range(100000))
+    linked_list_12 = LinkedList.from_iterable(range(50000, 150000))
+
+    print("\nTest Case 6 (Large Lists):")
+    print("Union size:", union(linked_list_11, linked_list_12).size())  # Expected: 150000
+    print("Intersection size:", intersection(linked_list_11, linked_list_12).size())  # Expected: 50000
+
+    ## Test case 7 - Pre-sorted lists with duplicates
+    linked_list_13 = LinkedList.from_iterable([-2, 0, 0, 1, 4, 4, 9])
+    linked_list_14 = LinkedList.from_iterable([0, 1, 1, 3, 4, 10])
+
+    print("\nTest Case 7 (Sorted Merge):")
+    print("Union:", union(linked_list_13, linked_list_14, is_sorted=True))  # Expected: -2, 0, 1, 3, 4, 9, 10
+    print("Intersection:", intersection(linked_list_13, linked_list_14, is_sorted=True))  # Expected: 0, 1, 4
+
+    ## Test case 8 - N-way set algebra
+    posting_lists = [
+        LinkedList.from_iterable([1, 3, 5, 7, 9, 11]),
+        LinkedList.from_iterable([3, 5, 7, 3]),
+        LinkedList.from_iterable([7, 5, 2, 3, 8]),
+    ]
+
+    print("\nTest Case 8 (N-way):")
+    print("Union all:", union_all(posting_lists))  # Expected: 1, 3, 5, 7, 9, 11, 2, 8
+    print("Intersect all:", intersect_all(posting_lists))  # Expected: 3, 5, 7
+    print("Intersect none:", intersect_all([]))  # Expected: empty
+    print("Difference:", difference(posting_lists[0], posting_lists[2]))  # Expected: 1, 9, 11
+    print("Symmetric difference:", symmetric_difference(posting_lists[1], posting_lists[2]))  # Expected: 2, 8
+
+    ## Test case 9 - Lazy results stop early
+    from itertools import islice
+
+    print("\nTest Case 9 (Lazy):")
+    print("First 3 of union:", list(islice(iter_union(linked_list_11, linked_list_12), 3)))  # Expected: [0, 1, 2]
+    print("First 3 of intersection:", list(islice(iter_intersection(linked_list_11, linked_list_12), 3)))  # Expected: [50000, 50001, 50002]
+    print("First 2 of sorted union:", list(islice(iter_sorted_union(linked_list_13, linked_list_14), 2)))  # Expected: [-2, 0]
+
+    ## Test case 10 - Array-backed sequences
+    sequence_1 = IntSequence.from_iterable([3, 2, 4, 35, 6, 65, 6, 4, 3, 21])
+    sequence_2 = IntSequence.from_iterable([6, 32, 4, 9, 6, 1, 11, 21, 1])
+    sparse = IntSequence.from_iterable(range(0, 100000, 7))
+
+    print("\nTest Case 10 (IntSequence):")
+    print("Union:", array_union(sequence_1, sequence_2))  # Expected: 1, 2, 3, 4, 6, 9, 11, 21, 32, 35, 65
+    print("Intersection:", array_intersection(sequence_1, sequence_2))  # Expected: 4, 6, 21
+    sorted_sequence = IntSequence.from_iterable([3, 4, 6, 6, 21, 35, 65])
+    print("Galloping intersection:", array_intersection(sorted_sequence, sparse, is_sorted=True))  # Expected: 21, 35
+    print("Unsorted skewed intersection:", array_intersection(sequence_1, sparse))  # Expected: 21, 35
+
+    # IntSequence also works with the LinkedList set operations
+    print("Sorted union:", union(sorted_sequence, IntSequence.from_iterable([1, 6, 70]), is_sorted=True))  # Expected: 1, 3, 4, 6, 21, 35, 65, 70
+    print("Sorted intersection:", intersection(sorted_sequence, sparse, is_sorted=True))  # Expected: 21, 35
+    timings = benchmark_sequences(200000)
+    for name, measured in timings.items():
+        print(f"{name}: {measured['bytes_per_element']:.1f} bytes/element, {measured['seconds']:.3f}s")